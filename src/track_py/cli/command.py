@@ -36,33 +36,33 @@ def month(cmd: str = "") -> str:
     return response
 
 
-def gas(cmd: str = "") -> str:
+async def gas(cmd: str = "") -> str:
     offset = helper.get_offset_from_command(cmd)
-    response = sheet.process_gas_summary(offset)
+    response = await sheet.process_gas_summary(offset)
     return response
 
 
-def food(cmd: str = "") -> str:
+async def food(cmd: str = "") -> str:
     offset = helper.get_offset_from_command(cmd)
-    response = sheet.process_food_summary(offset)
+    response = await sheet.process_food_summary(offset)
     return response
 
 
-def dating(cmd: str = "") -> str:
+async def dating(cmd: str = "") -> str:
     offset = helper.get_offset_from_command(cmd)
-    response = sheet.process_dating_summary(offset)
+    response = await sheet.process_dating_summary(offset)
     return response
 
 
-def other(cmd: str = "") -> str:
+async def other(cmd: str = "") -> str:
     offset = helper.get_offset_from_command(cmd)
-    response = sheet.process_other_summary(offset)
+    response = await sheet.process_other_summary(offset)
     return response
 
 
-def investment(cmd: str = "") -> str:
+async def investment(cmd: str = "") -> str:
     offset = helper.get_offset_from_command(cmd)
-    response = sheet.get_investment_response(offset)
+    response = await sheet.get_investment_response(offset)
     return response
 
 
@@ -102,9 +102,9 @@ def salary(cmd: str = "") -> str:
     return response
 
 
-def income(cmd: str = "") -> str:
+async def income(cmd: str = "") -> str:
     offset = helper.get_offset_from_command(cmd)
-    response = sheet.process_income_summary(offset)
+    response = await sheet.process_income_summary(offset)
     return response
 
 
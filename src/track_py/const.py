@@ -136,6 +136,11 @@ DELETE_EXPENSE_MSG = """
 ⏱️ `del 14/10 10h30s45` → Ngày 14/10 lúc 10:30:45
 """
 
+ERR_SYSTEM = "❌ Có lỗi hệ thống xảy ra. Vui lòng thử lại sau!\n\nLỗi: "
+ERR_FETCH_DATA = "❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: "
+ERR_FETCH_ASSET = "❌ Không thể lấy dữ liệu tài sản. Vui lòng thử lại!\n\nLỗi: "
+ERR_SAVE_INCOME = "❌ Có lỗi xảy ra khi ghi nhận thu nhập. Vui lòng thử lại!\n\nLỗi: "
+
 FOOD_KEYWORDS = ["ăn", "cơm", "hủ tiếu", "bánh cuốn", "uống", "nước"]
 DATING_KEYWORDS = [
     "hanuri",
@@ -208,6 +213,17 @@ LIST_KEYWORDS = {
     SUPPORT_PARENT: SUPPORT_PARENT_KEYWORDS,
 }
 
+# Keywords per expense category tag, in the order notes are classified
+NOTE_CATEGORY_KEYWORDS = {
+    "food": FOOD_KEYWORDS,
+    "gas": TRANSPORT_KEYWORDS,
+    RENT: RENT_KEYWORD,
+    DATING: DATING_KEYWORDS,
+    LONG_INVEST: LONG_INVEST_KEYWORDS,
+    OPPORTUNITY_INVEST: OPPORTUNITY_INVEST_KEYWORDS,
+    SUPPORT_PARENT: SUPPORT_PARENT_KEYWORDS,
+}
+
 CATEGORY_ICONS = {
     FOOD_TRAVEL: "🍔/⛽",
     DATING: "💖",
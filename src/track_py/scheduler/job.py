@@ -5,7 +5,7 @@ from src.track_py.utils.logger import logger
 from src.track_py.utils.bot import send_message
 from src.track_py.utils.timezone import get_current_time
 import atexit
-from dateutil.relativedelta import relativedelta
+from src.track_py.utils.datetime import add_months
 import asyncio
 
 scheduler = BackgroundScheduler(timezone=config["settings"]["timezone"])
@@ -73,7 +73,7 @@ def create_next_month_sheet():
         now = get_current_time()
 
         # Calculate next month
-        next_month = now + relativedelta(months=1)
+        next_month = add_months(now, 1)
         next_month_str = next_month.strftime("%m/%Y")
 
         logger.info(f"📅 Current month: {now.strftime('%m/%Y')}")
@@ -63,6 +63,24 @@ async def wait_for_background_tasks(timeout=30) -> bool:
         return True
 
 
+async def wait_for_handler_tasks(timeout=30) -> bool:
+    """Wait for handler tasks started with block=False in the current event loop"""
+    current_task = asyncio.current_task()
+    pending = {
+        task
+        for task in asyncio.all_tasks()
+        if task is not current_task and not task.done()
+    }
+    if not pending:
+        return True
+
+    _, pending = await asyncio.wait(pending, timeout=timeout)
+    if pending:
+        logger.warning(f"Timeout waiting for {len(pending)} handler tasks")
+        return False
+    return True
+
+
 async def process_log_expense_queue() -> None:
     """Process expenses from queue in batches for better API efficiency"""
     global _log_queue_processor_running
@@ -311,6 +329,52 @@ async def process_get_expense_queue() -> None:
         _get_queue_processor_running = False
 
 
+def append_month_expenses(target_month: str, expenses: list[dict]) -> None:
+    """Append expenses (and any asset rows) for a month, then invalidate its cache"""
+    current_sheet = sheet.get_cached_worksheet(target_month)
+    logger.info(f"Got sheet for month {target_month}: {current_sheet.title}")
+
+    rows_to_append = []
+    asset_expenses = []
+    for expense_data in expenses:
+        rows_to_append.append(
+            [
+                expense_data["entry_date"],
+                expense_data["entry_time"],
+                int(expense_data["amount"]),
+                expense_data["note"],
+            ]
+        )
+
+        # Check if this expense should also be logged to asset sheet
+        note = expense_data["note"].lower()
+        if sheet.has_keyword(note, const.LONG_INVEST_KEYWORDS) or sheet.has_keyword(
+            note, const.OPPORTUNITY_INVEST_KEYWORDS
+        ):
+            logger.info(f"Logging asset expense for note: {expense_data}")
+            asset_expenses.append(expense_data)
+
+    # Batch append all rows at once (more efficient than individual appends)
+    current_sheet.append_rows(
+        rows_to_append, value_input_option="RAW", table_range="A2:D"
+    )
+
+    # Also log to asset sheet if applicable, fetching prices only when needed
+    if asset_expenses:
+        asset_sheet = sheet.get_cached_worksheet(
+            config["settings"]["assets_sheet_name"]
+        )
+        prices = asset.prepare_prices()
+        asset_sheet.append_rows(
+            [sheet.prepare_asset_to_append(e, prices) for e in asset_expenses],
+            value_input_option="RAW",
+            table_range="A2:D",
+        )
+
+    # Invalidate cache since we've updated the sheet
+    sheet.invalidate_sheet_cache(target_month)
+
+
 async def process_log_month_expenses(target_month: str, expenses: list[dict]) -> None:
     """Process all expenses for a specific month"""
     try:
@@ -328,74 +392,8 @@ async def process_log_month_expenses(target_month: str, expenses: list[dict]) ->
             )
             await send_progress_update(expense_data, progress_message)
 
-        # Get sheet once for all expenses in this month
-        current_sheet = await asyncio.to_thread(
-            sheet.get_cached_worksheet, target_month
-        )
-        logger.info(f"Got sheet for month {target_month}: {current_sheet.title}")
-
-        asset_sheet = await asyncio.to_thread(
-            sheet.get_cached_worksheet, config["settings"]["assets_sheet_name"]
-        )
-        logger.info(f"Got asset sheet: {asset_sheet.title}")
-
-        # Prepare all rows for batch append
-        rows_to_append = []
-        assets_to_append = []
-
-        # Prepare asset prices once
-        prices = asset.prepare_prices()
-
-        for expense_data in expenses:
-            row = [
-                expense_data["entry_date"],
-                expense_data["entry_time"],
-                int(expense_data["amount"]),
-                expense_data["note"],
-            ]
-            rows_to_append.append(row)
-
-            # Check if this expense should also be logged to asset sheet
-            note = expense_data["note"].lower()
-            if sheet.has_keyword(note, const.LONG_INVEST_KEYWORDS) or sheet.has_keyword(
-                note, const.OPPORTUNITY_INVEST_KEYWORDS
-            ):
-                logger.info(f"Logging asset expense for note: {expense_data}")
-                asset_row = sheet.prepare_asset_to_append(expense_data, prices)
-                assets_to_append.append(asset_row)
-
-        # Batch append all rows at once (more efficient than individual appends)
-        if len(rows_to_append) == 1:
-            # Single expense - use append_row
-            await asyncio.to_thread(
-                lambda: current_sheet.append_row(
-                    rows_to_append[0], value_input_option="RAW", table_range="A2:D"
-                )
-            )
-        else:
-            # Multiple expenses - use batch append
-            await asyncio.to_thread(
-                lambda: current_sheet.append_rows(
-                    rows_to_append, value_input_option="RAW", table_range="A2:D"
-                )
-            )
-
-        # Also log to asset sheet if applicable
-        if assets_to_append:
-            await asyncio.to_thread(
-                lambda: asset_sheet.append_row(
-                    assets_to_append[0], value_input_option="RAW", table_range="A2:D"
-                )
-            )
-        else:
-            await asyncio.to_thread(
-                lambda: asset_sheet.append_rows(
-                    assets_to_append, value_input_option="RAW", table_range="A2:D"
-                )
-            )
-
-        # Invalidate cache since we've updated the sheet
-        sheet.invalidate_sheet_cache(target_month)
+        # Append, log assets and invalidate in a single worker thread hop
+        await asyncio.to_thread(append_month_expenses, target_month, expenses)
 
         logger.info(f"Batch processed {len(expenses)} expenses for {target_month}")
 
@@ -415,6 +413,15 @@ async def process_log_month_expenses(target_month: str, expenses: list[dict]) ->
         raise
 
 
+def delete_month_row(target_month: str, row: int) -> None:
+    """Delete one sheet row for a month, then invalidate its cache"""
+    current_sheet = sheet.get_cached_worksheet(target_month)
+    current_sheet.delete_rows(row)
+
+    # Rows below shift up, so the cached row index must not be reused
+    sheet.invalidate_sheet_cache(target_month)
+
+
 async def process_delete_month_expenses(
     target_month: str, expenses: list[dict]
 ) -> None:
@@ -432,23 +439,18 @@ async def process_delete_month_expenses(
             )
             await send_progress_update(expense_data, progress_message)
 
-        # Get sheet once for all expenses in this month
-        current_sheet = await asyncio.to_thread(
-            sheet.get_cached_worksheet, target_month
-        )
-        logger.info(f"Got sheet for month {target_month}: {current_sheet.title}")
-
         # Process each delete request
         for expense_data in expenses:
             entry_date = expense_data["entry_date"]
             entry_time = expense_data["entry_time"]
 
             try:
-                # Get all sheet data to search for the expense
-                all_values = await asyncio.to_thread(
-                    sheet.get_cached_sheet_data, target_month
+                # Look the expense up in a (date, time) index of fresh data,
+                # rows are deleted by position
+                columns, index = await asyncio.to_thread(
+                    sheet.get_cached_delete_index, target_month, True
                 )
-                if not all_values or len(all_values) < 2:
+                if not index:
                     logger.warning(f"No data in sheet {target_month} for deletion")
                     await send_error_notification(
                         expense_data,
@@ -456,28 +458,17 @@ async def process_delete_month_expenses(
                         const.DELETE_ACTION,
                     )
                     continue
-                records = sheet.convert_values_to_records(all_values)
 
                 found_row = None
-                for i, r in enumerate(records):
-                    row_date = r["date"]
-                    row_time = r["time"]
-                    row_amount = sheet.parse_amount(r["vnd"])
-                    row_note = r["note"]
-                    expense_data["amount"] = int(row_amount)
-                    expense_data["note"] = row_note
-
-                    if row_date == entry_date and row_time == entry_time:
-                        found_row = (
-                            i + 2
-                        )  # +2 because records start from row 2 (header is row 1)
-                        break
+                i = index.get((entry_date, entry_time))
+                if i is not None:
+                    found_row = columns["rows"][i]
+                    expense_data["amount"] = int(columns["amounts"][i])
+                    expense_data["note"] = columns["notes"][i]
 
                 if found_row:
-                    # Delete the row from the sheet
-                    await asyncio.to_thread(
-                        lambda: current_sheet.delete_rows(found_row)
-                    )
+                    # Delete the row and invalidate in a single worker thread hop
+                    await asyncio.to_thread(delete_month_row, target_month, found_row)
                     logger.info(
                         f"Successfully deleted expense: {entry_date} {entry_time} from row {found_row}"
                     )
@@ -500,9 +491,6 @@ async def process_delete_month_expenses(
                 )
                 continue
 
-        # Invalidate cache since we've updated the sheet
-        sheet.invalidate_sheet_cache(target_month)
-
         logger.info(f"Batch processed {len(expenses)} expenses for {target_month}")
 
         # Send success notifications after sheet operations complete
@@ -1,3 +1,4 @@
+import calendar
 import datetime
 import src.track_py.utils.sheet as sheet
 from src.track_py.utils.logger import logger
@@ -8,8 +9,9 @@ def parse_date_time(row: list[str]) -> datetime.datetime:
     if len(row) < 2 or not row[0]:
         return datetime.datetime.min
 
-    date_str = row[0].strip()
-    time_str = row[1].strip() if row[1] else "00:00:00"
+    # Unformatted reads may return non-string cells
+    date_str = str(row[0]).strip()
+    time_str = str(row[1]).strip() if row[1] else "00:00:00"
 
     try:
         # Normalize time format first
@@ -26,3 +28,18 @@ def parse_date_time(row: list[str]) -> datetime.datetime:
     except (ValueError, TypeError) as e:
         logger.debug(f"Failed to parse date/time '{date_str} {time_str}': {e}")
         return datetime.datetime.min
+
+
+# Shift by whole months
+def add_months(dt: datetime.datetime, months: int) -> datetime.datetime:
+    """Add months to a datetime, clamping the day to the target month's length"""
+    year, month = divmod(dt.year * 12 + dt.month - 1 + months, 12)
+    month += 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
+
+
+# Sheet name for a month
+def month_sheet_name(dt: datetime.datetime) -> str:
+    """Format a datetime as its monthly sheet name (MM/YYYY) without strftime"""
+    return f"{dt.month:02d}/{dt.year}"
@@ -1,10 +1,11 @@
 import os
+import json
+import threading
 import gspread
 import time
 import re
 import asyncio
 import datetime
-from dateutil.relativedelta import relativedelta
 from google.oauth2.service_account import Credentials
 from gspread.utils import a1_to_rowcol
 from src.track_py.utils.logger import logger
@@ -15,7 +16,7 @@ import src.track_py.const as const
 import src.track_py.utils.util as util
 from src.track_py.utils.category import category_display
 from src.track_py.utils.datetime import parse_date_time
-from typing import TypedDict
+from typing import Callable, TypedDict
 from huggingface_hub import InferenceClient
 from src.track_py.utils.util import markdown_to_html
 from src.track_py.config import config, save_config
@@ -26,10 +27,107 @@ import src.track_py.utils.sheet as sheet
 # Performance optimization: Cache for sheet data to reduce API calls
 _sheet_cache = {}
 _worksheet_cache = {}
+_worksheet_titles_cache: dict[str, gspread.Worksheet] | None = None
 _asset_sheet_cache = {}
+_records_by_date_cache = {}
+_columns_cache = {}
+_delete_index_cache = {}
+_date_index_cache = {}
+_category_total_cache = {}  # sheet name -> {category key: (columns, result)}
+_income_cache = {}
+_ai_summary_cache = {}  # sheet name -> (data digest, AI summary)
+_config_version = 0  # Bumped whenever config or income/budget cells change
 _cache_timeout = 300  # Cache timeout in seconds (5 minutes)
 _asset_cache_timeout = 600  # Longer cache for asset sheet (10 minutes)
 _today_cache_timeout = 60  # Shorter cache for today's data (1 minute)
+_income_cache_timeout = 30  # Income cells change only via /salary, /freelance
+
+# Read amounts as native numbers so parse_amount short-circuits, while dates
+# and times keep their formatted strings
+_values_render_options = {
+    "value_render_option": "UNFORMATTED_VALUE",
+    "date_time_render_option": "FORMATTED_STRING",
+}
+
+# Disk cache so month data survives process restarts. Past months rarely change,
+# but can still be edited directly in Google Sheets, so they expire after a day
+_disk_cache_dir = os.path.join(PROJECT_ROOT, ".sheet_cache")
+_past_month_cache_timeout = 86400  # 1 day
+
+
+def _get_disk_cache_path(sheet_name: str) -> str:
+    """Get the disk cache file path for a month sheet"""
+    spreadsheet_id = config["google_sheets"]["spreadsheet_id"]
+    file_name = f"{spreadsheet_id}_{sheet_name.replace('/', '_')}.json"
+    return os.path.join(_disk_cache_dir, file_name)
+
+
+# helper for the sheet data timeout: past months are trusted for longer
+def _get_sheet_data_timeout(sheet_name: str) -> int:
+    if sheet_name == get_current_time().strftime("%m/%Y"):
+        return _cache_timeout
+    return _past_month_cache_timeout
+
+
+def _load_disk_cached_sheet_data(
+    sheet_name: str,
+) -> tuple[list[list[str]], float] | None:
+    """Load sheet data and its write time from disk, None if missing or expired"""
+    path = _get_disk_cache_path(sheet_name)
+    try:
+        mtime = os.path.getmtime(path)
+        if time.time() - mtime >= _get_sheet_data_timeout(sheet_name):
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f), mtime
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read disk cache for sheet {sheet_name}: {e}")
+        return None
+
+
+def _save_disk_cached_sheet_data(sheet_name: str, all_values: list[list[str]]):
+    """Write sheet data to disk atomically"""
+    path = _get_disk_cache_path(sheet_name)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(_disk_cache_dir, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(all_values, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write disk cache for sheet {sheet_name}: {e}")
+
+
+def _refresh_worksheet_titles() -> dict[str, gspread.Worksheet]:
+    """Fetch all worksheet handles with a single metadata request"""
+    global _worksheet_titles_cache
+    _worksheet_titles_cache = {
+        ws.title: ws for ws in sheet.get_spreadsheet().worksheets()
+    }
+    logger.debug(f"Refreshed worksheet titles: {len(_worksheet_titles_cache)} sheets")
+    return _worksheet_titles_cache
+
+
+def get_worksheet_by_name(sheet_name: str) -> gspread.Worksheet:
+    """Get a worksheet handle by name from the cached title lookup"""
+    titles = _worksheet_titles_cache
+    if titles is None or sheet_name not in titles:
+        # Refresh on a miss to pick up sheets created elsewhere
+        titles = _refresh_worksheet_titles()
+
+    worksheet = titles.get(sheet_name)
+    if worksheet is None:
+        raise gspread.WorksheetNotFound(sheet_name)
+    return worksheet
+
+
+def add_worksheet_to_cache(worksheet: gspread.Worksheet):
+    """Register a newly created worksheet in the title lookup"""
+    if _worksheet_titles_cache is not None:
+        _worksheet_titles_cache[worksheet.title] = worksheet
 
 
 def get_cached_worksheet(
@@ -62,23 +160,36 @@ def get_cached_worksheet(
 def get_cached_sheet_data(
     sheet_name: str, force_refresh: bool = False
 ) -> list[list[str]]:
-    """Get cached sheet data or fetch fresh if expired"""
+    """
+    Get cached sheet data or fetch fresh if expired.
+    Callers that write back by row position must pass force_refresh=True.
+    """
     current_time = time.time()
     cache_key = f"data_{sheet_name}"
 
     if not force_refresh and cache_key in _sheet_cache:
         data, timestamp = _sheet_cache[cache_key]
-        if current_time - timestamp < _cache_timeout:
+        if current_time - timestamp < _get_sheet_data_timeout(sheet_name):
             logger.debug(f"Using cached data for sheet {sheet_name}")
             return data
 
+    # Fall back to the disk cache before hitting the API
+    if not force_refresh:
+        disk_cached = _load_disk_cached_sheet_data(sheet_name)
+        if disk_cached is not None:
+            logger.debug(f"Using disk cached data for sheet {sheet_name}")
+            # Keep the file's write time so the timeout is not restarted
+            _sheet_cache[cache_key] = disk_cached
+            return disk_cached[0]
+
     # Fetch fresh data
     logger.debug(f"Fetching fresh data for sheet {sheet_name}")
     try:
         sheet = get_cached_worksheet(sheet_name)
         # Use get_values instead of get_all_records for better performance
-        all_values = sheet.get_values("A:D")
+        all_values = sheet.get_values("A:D", **_values_render_options)
         _sheet_cache[cache_key] = (all_values, current_time)
+        _save_disk_cached_sheet_data(sheet_name, all_values)
         return all_values
     except Exception as e:
         logger.error(f"Error fetching sheet data for {sheet_name}: {e}")
@@ -151,7 +262,7 @@ def get_cached_today_data(
                 logger.info(
                     f"Optimized fetch range: {fetch_range} (detected {last_row} rows)"
                 )
-                all_values = sheet.get_values(fetch_range)
+                all_values = sheet.get_values(fetch_range, **_values_render_options)
                 # logger.info(f"Fetched {all_values} rows for today data")
             else:
                 all_values = []
@@ -160,7 +271,7 @@ def get_cached_today_data(
                 f"Range optimization failed, using default range: {range_error}"
             )
             # Fallback to fixed range
-            all_values = sheet.get_values("A2:D1000")
+            all_values = sheet.get_values("A2:D1000", **_values_render_options)
 
         # Add header row for consistency with existing code
         if all_values:
@@ -183,6 +294,160 @@ def get_cached_today_data(
             raise
 
 
+def get_cached_sheet_columns(
+    sheet_name: str, force_refresh: bool = False
+) -> dict[str, list]:
+    """Get month data as columns, rebuilt only when the cached values change"""
+    all_values = get_cached_sheet_data(sheet_name, force_refresh)
+
+    cached = _columns_cache.get(sheet_name)
+    if cached and cached[0] is all_values:
+        return cached[1]
+
+    columns = sheet.convert_values_to_columns(all_values)
+    _columns_cache[sheet_name] = (all_values, columns)
+    return columns
+
+
+def get_cached_delete_index(
+    sheet_name: str, force_refresh: bool = False
+) -> tuple[dict[str, list], dict[tuple[str, str], int]]:
+    """
+    Get month columns plus a (normalized date, normalized time) -> column index
+    lookup for deletes, rebuilt only when the cached values change.
+    """
+    columns = get_cached_sheet_columns(sheet_name, force_refresh)
+
+    cached = _delete_index_cache.get(sheet_name)
+    if cached and cached[0] is columns:
+        return columns, cached[1]
+
+    index = {}
+    for i, (date, time_str) in enumerate(zip(columns["dates"], columns["times"])):
+        # Keep the first match, like the old top-down scan
+        index.setdefault(
+            (sheet.normalize_date(date), sheet.normalize_time(time_str)), i
+        )
+
+    _delete_index_cache[sheet_name] = (columns, index)
+    return columns, index
+
+
+def get_cached_date_index(
+    sheet_name: str,
+) -> tuple[dict[str, list], dict[str, list[int]]]:
+    """
+    Get month columns plus a normalized date -> column indices lookup for
+    rows with a non-zero amount, rebuilt only when the cached values change.
+    """
+    columns = get_cached_sheet_columns(sheet_name)
+
+    cached = _date_index_cache.get(sheet_name)
+    if cached and cached[0] is columns:
+        return columns, cached[1]
+
+    index = defaultdict(list)
+    for i, (date, amount) in enumerate(zip(columns["dates"], columns["amounts"])):
+        if amount and date:
+            index[sheet.normalize_date(date)].append(i)
+    index = dict(index)
+
+    _date_index_cache[sheet_name] = (columns, index)
+    return columns, index
+
+
+def get_cached_category_total(
+    sheet_name: str,
+    category_key,
+    total_fn: Callable[[dict[str, list]], tuple[list[sheet.Record], int]],
+) -> tuple[list[sheet.Record], int]:
+    """
+    Get a category's (expenses, total) for a month, computed by total_fn from
+    the month columns and recomputed only when the cached values change.
+    """
+    columns = get_cached_sheet_columns(sheet_name)
+
+    month_cache = _category_total_cache.setdefault(sheet_name, {})
+    cached = month_cache.get(category_key)
+    if cached and cached[0] is columns:
+        return cached[1]
+
+    result = total_fn(columns)
+    month_cache[category_key] = (columns, result)
+    return result
+
+
+def get_cached_records_for_date(sheet_name: str, date_str: str) -> list[sheet.Record]:
+    """
+    Get today-data records for one date. Rows are indexed by date as column
+    positions, so record dicts are only built for the requested date.
+    """
+    all_values = get_cached_today_data(sheet_name, date_str)
+
+    cached = _records_by_date_cache.get(sheet_name)
+    if cached and cached[0] is all_values:
+        columns, indices_by_date = cached[1], cached[2]
+    else:
+        columns = sheet.convert_values_to_columns(all_values)
+        indices_by_date = defaultdict(list)
+        for i, date in enumerate(columns["dates"]):
+            indices_by_date[date.lstrip("'")].append(i)
+        indices_by_date = dict(indices_by_date)
+        _records_by_date_cache[sheet_name] = (all_values, columns, indices_by_date)
+
+    indices = indices_by_date.get(date_str)
+    if not indices:
+        return []
+    return sheet.columns_to_records(columns, indices)
+
+
+def get_cached_income(sheet_id: int) -> int | None:
+    """Get cached total income for a worksheet, None if missing or expired"""
+    if sheet_id in _income_cache:
+        total_income, timestamp = _income_cache[sheet_id]
+        if time.time() - timestamp < _income_cache_timeout:
+            logger.debug(f"Using cached income for sheet id {sheet_id}")
+            return total_income
+    return None
+
+
+def set_cached_income(sheet_id: int, total_income: int):
+    """Cache total income for a worksheet"""
+    _income_cache[sheet_id] = (total_income, time.time())
+
+
+def invalidate_income_cache(sheet_id: int):
+    """Invalidate cached total income for a worksheet"""
+    if _income_cache.pop(sheet_id, None) is not None:
+        logger.debug(f"Invalidated income cache for sheet id {sheet_id}")
+
+
+def get_cached_ai_summary(sheet_name: str, data_digest: str) -> str | None:
+    """Get the cached AI summary for a sheet if it was built from the same data"""
+    cached = _ai_summary_cache.get(sheet_name)
+    if cached and cached[0] == data_digest:
+        logger.debug(f"Using cached AI summary for sheet {sheet_name}")
+        return cached[1]
+    return None
+
+
+def set_cached_ai_summary(sheet_name: str, data_digest: str, summary: str):
+    """Cache the AI summary for a sheet along with the digest of its input data"""
+    _ai_summary_cache[sheet_name] = (data_digest, summary)
+
+
+def get_config_version() -> int:
+    """Get the current config version used to key memoized budget reads"""
+    return _config_version
+
+
+def bump_config_version():
+    """Invalidate memoized budget and percentage reads after config changes"""
+    global _config_version
+    _config_version += 1
+    logger.debug(f"Config version bumped to {_config_version}")
+
+
 def invalidate_sheet_cache(sheet_name: str):
     """Invalidate cache for a specific sheet"""
     data_key = f"data_{sheet_name}"
@@ -192,6 +457,21 @@ def invalidate_sheet_cache(sheet_name: str):
         del _sheet_cache[data_key]
         logger.debug(f"Invalidated data cache for sheet {sheet_name}")
 
+    try:
+        os.remove(_get_disk_cache_path(sheet_name))
+        logger.debug(f"Invalidated disk cache for sheet {sheet_name}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Could not remove disk cache for sheet {sheet_name}: {e}")
+
+    _records_by_date_cache.pop(sheet_name, None)
+    _columns_cache.pop(sheet_name, None)
+    _delete_index_cache.pop(sheet_name, None)
+    _date_index_cache.pop(sheet_name, None)
+    _category_total_cache.pop(sheet_name, None)
+    _ai_summary_cache.pop(sheet_name, None)
+
     if data_key in _asset_sheet_cache:
         del _asset_sheet_cache[data_key]
         logger.debug(f"Invalidated asset data cache for sheet {sheet_name}")
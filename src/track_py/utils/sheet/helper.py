@@ -3,8 +3,8 @@ import gspread
 import time
 import re
 import asyncio
+import functools
 import datetime
-from dateutil.relativedelta import relativedelta
 from google.oauth2.service_account import Credentials
 from gspread.utils import a1_to_rowcol
 from src.track_py.utils.logger import logger
@@ -23,6 +23,30 @@ from collections import defaultdict
 import src.track_py.utils.sheet as sheet
 
 
+# Characters stripped from amount cells before numeric conversion
+_AMOUNT_STRIP_CHARS = str.maketrans("", "", ",₫")
+_NUMERIC_AMOUNT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+
+# Dates and times already in the canonical form the bot writes to the sheet
+_CANONICAL_DATE_RE = re.compile(r"\d{2}/\d{2}")
+_CANONICAL_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2}")
+
+
+# Keyword lookup tables built once: single-word keywords map to their category
+# tags by token, multi-word keywords are matched as substrings
+_KEYWORD_TOKEN_TAGS: dict[str, set[str]] = defaultdict(set)
+_KEYWORD_PHRASE_TAGS: list[tuple[str, str]] = []
+for _tag, _keywords in const.NOTE_CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        _keyword = _keyword.lower()
+        if " " in _keyword:
+            _KEYWORD_PHRASE_TAGS.append((_keyword, _tag))
+        else:
+            _KEYWORD_TOKEN_TAGS[_keyword].add(_tag)
+_KEYWORD_TOKEN_TAGS = dict(_KEYWORD_TOKEN_TAGS)
+
+
 class AssetRecord(TypedDict):
     date: str
     time: str
@@ -42,7 +66,7 @@ def parse_amount(value: int | float | str) -> int:
 
     if isinstance(value, str):
         # Remove everything except digits
-        cleaned = re.sub(r"[^\d]", "", value)
+        cleaned = _NON_DIGIT_RE.sub("", value)
         if cleaned.isdigit():
             return int(cleaned)
 
@@ -50,11 +74,28 @@ def parse_amount(value: int | float | str) -> int:
     return 0
 
 
+def normalize_amount_column(rows: list[list], col: int = 2) -> None:
+    """
+    Convert amount cells like '1,500,000₫' into ints in place.
+    Cells that are not numeric are left untouched.
+    """
+    for row in rows:
+        if len(row) <= col or not row[col] or isinstance(row[col], int):
+            continue
+
+        cleaned = str(row[col]).translate(_AMOUNT_STRIP_CHARS).strip()
+        if _NUMERIC_AMOUNT_RE.fullmatch(cleaned):
+            row[col] = int(float(cleaned))
+
+
 def normalize_date(date_str: str) -> str:
     """
     Normalize a date like '4/9' or '4/10' into '04/09' or '04/10'.
     Keeps only day/month (no year).
     """
+    if _CANONICAL_DATE_RE.fullmatch(date_str):
+        return date_str
+
     try:
         day, month = date_str.split("/")
         return f"{day.zfill(2)}/{month.zfill(2)}"
@@ -73,6 +114,9 @@ def normalize_time(time_str: str) -> str:
     - '10:05'     -> '10:05:00'
     - '10:05:30'  -> '10:05:30' (unchanged)
     """
+    if _CANONICAL_TIME_RE.fullmatch(time_str):
+        return time_str
+
     time_str = time_str.strip().lower().replace(" ", "")
 
     if "h" in time_str:
@@ -141,6 +185,26 @@ def has_keyword(note: str, keywords: list[str]) -> bool:
     return False
 
 
+def get_note_categories(note: str) -> set[str]:
+    """
+    Get every category tag whose keywords appear in the note, in a single scan.
+    Uses the same matching rules as has_keyword; an empty set means "other".
+    """
+    note = note.lower()
+    tags = set()
+
+    for token in note.split():
+        token_tags = _KEYWORD_TOKEN_TAGS.get(token)
+        if token_tags:
+            tags |= token_tags
+
+    for phrase, tag in _KEYWORD_PHRASE_TAGS:
+        if phrase in note:
+            tags.add(tag)
+
+    return tags
+
+
 def safe_int(value: str) -> int:
     """Convert a string value to int safely, removing non-digit characters"""
     if not value:
@@ -151,28 +215,82 @@ def safe_int(value: str) -> int:
     return int(text) if text.isdigit() else 0
 
 
-def convert_values_to_records(all_values: list[list[str]]) -> list[sheet.Record]:
-    """Convert raw sheet values to record format (list of dicts) with optimization"""
+def convert_values_to_columns(all_values: list[list[str]]) -> dict[str, list]:
+    """
+    Convert raw sheet values to parallel column lists (one entry per kept row):
+    rows (sheet row number), dates, times, vnds, amounts, notes, notes_lower.
+    """
+    columns = {
+        "rows": [],
+        "dates": [],
+        "times": [],
+        "vnds": [],
+        "amounts": [],
+        "notes": [],
+        "notes_lower": [],
+    }
     if not all_values or len(all_values) < 2:  # Need at least header + 1 data row
-        return []
-
-    records = []
-    for row in all_values[1:]:  # Skip header
-        # Create record with proper error handling
-        record = sheet.Record(
+        return columns
+
+    rows = columns["rows"]
+    dates = columns["dates"]
+    times = columns["times"]
+    vnds = columns["vnds"]
+    amounts = columns["amounts"]
+    notes = columns["notes"]
+    notes_lower = columns["notes_lower"]
+
+    for row_number, row in enumerate(all_values[1:], start=2):  # Skip header
+        length = len(row)
+        date = str(row[0]).strip() if length > 0 else ""
+        vnd = row[2] if length > 2 else 0
+
+        # Only keep rows that have at least a date or amount
+        if not date and not vnd:
+            continue
+
+        note = str(row[3]).strip() if length > 3 else ""
+        rows.append(row_number)
+        dates.append(date)
+        times.append(str(row[1]).strip() if length > 1 else "")
+        vnds.append(vnd)
+        # Parse the amount once for every downstream total
+        amounts.append(parse_amount(vnd) if vnd else 0)
+        notes.append(note)
+        notes_lower.append(note.lower())
+
+    return columns
+
+
+def columns_to_records(
+    columns: dict[str, list], indices: list[int] | None = None
+) -> list[sheet.Record]:
+    """Build record dicts from columns, only for the given row indices if set"""
+    dates = columns["dates"]
+    times = columns["times"]
+    vnds = columns["vnds"]
+    amounts = columns["amounts"]
+    notes = columns["notes"]
+    if indices is None:
+        indices = range(len(dates))
+
+    return [
+        sheet.Record(
             {
-                "date": (row[0] if len(row) > 0 else "").strip(),
-                "time": (row[1] if len(row) > 1 else "").strip(),
-                "vnd": row[2] if len(row) > 2 else 0,
-                "note": (row[3] if len(row) > 3 else "").strip(),
+                "date": dates[i],
+                "time": times[i],
+                "vnd": vnds[i],
+                "note": notes[i],
+                "amount": amounts[i],
             }
         )
+        for i in indices
+    ]
 
-        # Only add records that have at least a date or amount
-        if record["date"] or record["vnd"]:
-            records.append(record)
 
-    return records
+def convert_values_to_records(all_values: list[list[str]]) -> list[sheet.Record]:
+    """Convert raw sheet values to record format (list of dicts) with optimization"""
+    return columns_to_records(convert_values_to_columns(all_values))
 
 
 def convert_values_to_asset_records(
@@ -204,9 +322,16 @@ def convert_values_to_asset_records(
 
 def format_expense(r: sheet.Record, index=None):
     """Format an expense record into a readable string"""
-    time_str = r["time"] or "—"
-    amount_str = f"{parse_amount(r['vnd']):,.0f} VND"
-    note_str = r["note"].lower() or ""
+    prefix = f"{index}. " if index is not None else ""
+    return prefix + _format_expense_body(r["time"], r["vnd"], r["note"])
+
+
+# helper for format_expense, memoized on the row values it reads
+@functools.lru_cache(maxsize=2048)
+def _format_expense_body(time_value: str, vnd: int | float | str, note: str) -> str:
+    time_str = time_value or "—"
+    amount_str = f"{parse_amount(vnd):,.0f} VND"
+    note_str = note.lower() or ""
 
     if has_keyword(note_str, const.FOOD_KEYWORDS):
         note_icon = const.CATEGORY_ICONS["food"]
@@ -225,8 +350,7 @@ def format_expense(r: sheet.Record, index=None):
     else:
         note_icon = "📝"
 
-    prefix = f"{index}. " if index is not None else ""
-    return f"{prefix}⏰ {time_str} | 💰 {amount_str} | {note_icon} {note_str}"
+    return f"⏰ {time_str} | 💰 {amount_str} | {note_icon} {note_str}"
 
 
 def process_percent_change(new_value, original_value) -> str:
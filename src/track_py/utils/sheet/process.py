@@ -1,10 +1,10 @@
 import os
+import hashlib
 import gspread
 import time
 import re
 import asyncio
 import datetime
-from dateutil.relativedelta import relativedelta
 from google.oauth2.service_account import Credentials
 from gspread.utils import a1_to_rowcol
 from src.track_py.utils.logger import logger
@@ -14,8 +14,8 @@ from src.track_py.utils.logger import logger
 import src.track_py.const as const
 import src.track_py.utils.util as util
 from src.track_py.utils.category import category_display
-from src.track_py.utils.datetime import parse_date_time
-from typing import TypedDict
+from src.track_py.utils.datetime import parse_date_time, add_months, month_sheet_name
+from typing import Callable, TypedDict
 from huggingface_hub import InferenceClient
 from src.track_py.utils.util import markdown_to_html
 from src.track_py.config import config, save_config
@@ -23,6 +23,34 @@ from collections import defaultdict
 import src.track_py.utils.sheet as sheet
 
 
+# shared inference client and prompt for AI analysis
+_HF_CLIENT = InferenceClient(token=const.HUGGING_FACE_TOKEN)
+_HF_MODEL = "meta-llama/Llama-3.1-8B-Instruct"
+_AI_SYSTEM_PROMPT = (
+    "Bạn là một trợ lý tài chính cá nhân thông minh, phản hồi hoàn toàn bằng tiếng Việt. "
+    "Phân tích dữ liệu chi tiêu hàng tháng (bao gồm thu nhập, ngân sách và chi tiêu thực tế) để đưa ra phân tích và khuyến nghị.\n\n"
+    "⚙️ Quy ước dữ liệu:\n"
+    "- Mỗi dòng chi tiêu có dạng: <Tên hạng mục>: <Chi tiêu thực tế> VND (<Chênh lệch>)\n"
+    "- Giá trị trong ngoặc thể hiện CHÊNH LỆCH giữa chi tiêu thực tế và ngân sách:\n"
+    "    • Dấu (+) nghĩa là chi tiêu ÍT HƠN ngân sách (TIẾT KIỆM)\n"
+    "    • Dấu (-) nghĩa là chi tiêu NHIỀU HƠN ngân sách (VƯỢT CHI)\n"
+    "- Ví dụ: (+1,000,000) = tiết kiệm 1 triệu. (-500,000) = vượt ngân sách 500 nghìn.\n\n"
+    "⚙️ Phân tích yêu cầu:\n"
+    "1️⃣ Xác định các hạng mục chi vượt ngân sách (dấu -) và hạng mục tiết kiệm (dấu +), nêu rõ số tiền chênh lệch.\n"
+    "2️⃣ So sánh tổng chi tiêu và thu nhập để xác định thặng dư hoặc thâm hụt.\n"
+    "3️⃣ Phát hiện 2–3 xu hướng nổi bật trong chi tiêu.\n"
+    "4️⃣ Đưa ra 2–3 khuyến nghị cụ thể giúp cải thiện cân bằng tài chính.\n\n"
+    "📋 Định dạng đầu ra (HTML-friendly cho Telegram):\n"
+    "🧾 <b>Tóm tắt:</b> Một đoạn ngắn mô tả tình hình tài chính tháng.\n"
+    "📊 <b>Phân tích chi tiêu vượt ngân sách:</b> Liệt kê rõ từng mục vượt và tiết kiệm.\n"
+    "📈 <b>Xu hướng chi tiêu:</b> 2–3 xu hướng nổi bật.\n"
+    "💡 <b>Khuyến nghị:</b> 2–3 gợi ý cụ thể.\n\n"
+    "💬 <b>Yêu cầu:</b>\n"
+    "- Giọng văn thân thiện, chuyên nghiệp, có cảm xúc.\n"
+    "- Sử dụng emoji phù hợp (🧾📊📈💡💰✨...) để tăng tính dễ đọc.\n"
+)
+
+
 # helper for month response
 def get_month_response(
     records: list[sheet.Record],
@@ -108,7 +136,7 @@ def get_month_response(
 
 
 async def get_ai_analyze_summary(month_offset) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
+    now = add_months(get_current_time(), month_offset)
     target_month = now.strftime("%m/%Y")
 
     logger.info(f"Getting month expenses for sheet {target_month}")
@@ -126,89 +154,82 @@ async def get_ai_analyze_summary(month_offset) -> str:
         return
 
     try:
-        all_values = await asyncio.to_thread(sheet.get_cached_sheet_data, target_month)
-        logger.info(f"Retrieved {len(all_values)} records from sheet")
+        records = await asyncio.to_thread(sheet.get_month_records, target_month)
+        logger.info(f"Retrieved {len(records)} records from sheet")
     except Exception as records_error:
         logger.error(
             f"Error retrieving records from sheet: {records_error}", exc_info=True
         )
         return
 
-    records = sheet.convert_values_to_records(all_values)
     raw_data = get_month_response(records, current_sheet, now)
 
-    client = InferenceClient(token=const.HUGGING_FACE_TOKEN)
-    model = "meta-llama/Llama-3.1-8B-Instruct"
+    # Reuse the previous answer while the month's data is unchanged
+    data_digest = hashlib.blake2b(raw_data.encode(), digest_size=16).hexdigest()
+    cached_summary = sheet.get_cached_ai_summary(target_month, data_digest)
+    if cached_summary is not None:
+        return cached_summary
 
     # Use chat_completion for instruction/chat models
-    ai_response = client.chat_completion(
-        model=model,
+    ai_response = await asyncio.to_thread(
+        _HF_CLIENT.chat_completion,
+        model=_HF_MODEL,
         messages=[
-            {
-                "role": "system",
-                "content": (
-                    "Bạn là một trợ lý tài chính cá nhân thông minh, phản hồi hoàn toàn bằng tiếng Việt. "
-                    "Phân tích dữ liệu chi tiêu hàng tháng (bao gồm thu nhập, ngân sách và chi tiêu thực tế) để đưa ra phân tích và khuyến nghị.\n\n"
-                    "⚙️ Quy ước dữ liệu:\n"
-                    "- Mỗi dòng chi tiêu có dạng: <Tên hạng mục>: <Chi tiêu thực tế> VND (<Chênh lệch>)\n"
-                    "- Giá trị trong ngoặc thể hiện CHÊNH LỆCH giữa chi tiêu thực tế và ngân sách:\n"
-                    "    • Dấu (+) nghĩa là chi tiêu ÍT HƠN ngân sách (TIẾT KIỆM)\n"
-                    "    • Dấu (-) nghĩa là chi tiêu NHIỀU HƠN ngân sách (VƯỢT CHI)\n"
-                    "- Ví dụ: (+1,000,000) = tiết kiệm 1 triệu. (-500,000) = vượt ngân sách 500 nghìn.\n\n"
-                    "⚙️ Phân tích yêu cầu:\n"
-                    "1️⃣ Xác định các hạng mục chi vượt ngân sách (dấu -) và hạng mục tiết kiệm (dấu +), nêu rõ số tiền chênh lệch.\n"
-                    "2️⃣ So sánh tổng chi tiêu và thu nhập để xác định thặng dư hoặc thâm hụt.\n"
-                    "3️⃣ Phát hiện 2–3 xu hướng nổi bật trong chi tiêu.\n"
-                    "4️⃣ Đưa ra 2–3 khuyến nghị cụ thể giúp cải thiện cân bằng tài chính.\n\n"
-                    "📋 Định dạng đầu ra (HTML-friendly cho Telegram):\n"
-                    "🧾 <b>Tóm tắt:</b> Một đoạn ngắn mô tả tình hình tài chính tháng.\n"
-                    "📊 <b>Phân tích chi tiêu vượt ngân sách:</b> Liệt kê rõ từng mục vượt và tiết kiệm.\n"
-                    "📈 <b>Xu hướng chi tiêu:</b> 2–3 xu hướng nổi bật.\n"
-                    "💡 <b>Khuyến nghị:</b> 2–3 gợi ý cụ thể.\n\n"
-                    "💬 <b>Yêu cầu:</b>\n"
-                    "- Giọng văn thân thiện, chuyên nghiệp, có cảm xúc.\n"
-                    "- Sử dụng emoji phù hợp (🧾📊📈💡💰✨...) để tăng tính dễ đọc.\n"
-                ),
-            },
+            {"role": "system", "content": _AI_SYSTEM_PROMPT},
             {"role": "user", "content": f"{raw_data}"},
         ],
         max_tokens=1000,
     )
 
     summary = markdown_to_html(ai_response["choices"][0]["message"]["content"].strip())
+    sheet.set_cached_ai_summary(target_month, data_digest, summary)
     return summary
 
 
-def process_income_summary(month_offset: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
-    target_month = now.strftime("%m/%Y")
-    previous_month = (now - relativedelta(months=1)).strftime("%m/%Y")
+async def process_income_summary(month_offset: int) -> str:
+    now = add_months(get_current_time(), month_offset)
+    target_month = month_sheet_name(now)
+    previous_month = month_sheet_name(add_months(now, -1))
 
     logger.info(f"Getting income summary for sheet {target_month}")
 
-    try:
-        current_sheet = sheet.get_cached_worksheet(target_month)
-        logger.info(f"Successfully obtained sheet for {target_month}")
-    except Exception as sheet_error:
+    # The previous month is only read for comparison, so it is never created
+    current_sheet, previous_sheet = await asyncio.gather(
+        asyncio.to_thread(sheet.get_cached_worksheet, target_month),
+        asyncio.to_thread(sheet.get_monthly_sheet_if_exists, previous_month),
+        return_exceptions=True,
+    )
+
+    if isinstance(current_sheet, Exception):
         logger.error(
-            f"Error getting/creating sheet {target_month}: {sheet_error}",
-            exc_info=True,
+            f"Error getting/creating sheet {target_month}: {current_sheet}",
+            exc_info=current_sheet,
         )
         exit(1)
+    logger.info(f"Successfully obtained sheet for {target_month}")
 
-    try:
-        previous_sheet = sheet.get_cached_worksheet(previous_month)
-        logger.info(f"Successfully obtained sheet for {previous_month}")
-    except Exception as prev_sheet_error:
+    if isinstance(previous_sheet, Exception):
         logger.error(
-            f"Error getting/creating sheet {previous_month}: {prev_sheet_error}",
-            exc_info=True,
+            f"Error getting sheet {previous_month}: {previous_sheet}",
+            exc_info=previous_sheet,
         )
         exit(1)
 
+    # Read the income cells of both months in a single API call
+    if previous_sheet is None:
+        logger.info(f"Sheet {previous_month} does not exist, comparing against 0")
+        (current_income,) = await asyncio.to_thread(
+            sheet.get_income_cells, [current_sheet]
+        )
+        previous_income = ("", "")
+    else:
+        logger.info(f"Successfully obtained sheet for {previous_month}")
+        current_income, previous_income = await asyncio.to_thread(
+            sheet.get_income_cells, [current_sheet, previous_sheet]
+        )
+
     # Get income from current month's sheet
-    freelance_income = current_sheet.acell(const.FREELANCE_CELL).value
-    salary_income = current_sheet.acell(const.SALARY_CELL).value
+    freelance_income, salary_income = current_income
 
     if not freelance_income or freelance_income.strip() == "":
         logger.info("Freelance income cell is empty, using config fallback")
@@ -222,15 +243,14 @@ def process_income_summary(month_offset: int) -> str:
     salary_income = sheet.safe_int(salary_income)
 
     # Get income from previous month's sheet for comparison
-    prev_freelance_income = previous_sheet.acell(const.FREELANCE_CELL).value
-    prev_salary_income = previous_sheet.acell(const.SALARY_CELL).value
+    prev_freelance_income, prev_salary_income = previous_income
 
     if not prev_freelance_income or prev_freelance_income.strip() == "":
-        logger.info("Previous freelance income cell is empty, using config fallback")
+        logger.info("Previous freelance income cell is empty, using 0")
         prev_freelance_income = 0
 
     if not prev_salary_income or prev_salary_income.strip() == "":
-        logger.info("Previous salary income cell is empty, using config fallback")
+        logger.info("Previous salary income cell is empty, using 0")
         prev_salary_income = 0
 
     prev_freelance_income = sheet.safe_int(prev_freelance_income)
@@ -251,8 +271,8 @@ def process_income_summary(month_offset: int) -> str:
     else:
         percentage_text = ""
 
-    current_month = now.strftime("%m")
-    current_year = now.strftime("%Y")
+    current_month = f"{now.month:02d}"
+    current_year = str(now.year)
     month_display = util.get_month_display(current_month, current_year)
 
     summary = (
@@ -267,14 +287,14 @@ def process_income_summary(month_offset: int) -> str:
 
 
 def process_salary(month_offset: int, amount: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
+    now = add_months(get_current_time(), month_offset)
     target_month = now.strftime("%m/%Y")
     target_year = now.strftime("%Y")
     month_display = util.get_month_display(target_month, target_year)
     current_sheet = sheet.get_cached_worksheet(target_month)
 
     amount = amount * 1000
-    current_sheet.update_acell(const.SALARY_CELL, amount)
+    sheet.update_income_cells(current_sheet, {const.SALARY_CELL: amount})
 
     if month_offset == 0:
         # Update config
@@ -286,14 +306,14 @@ def process_salary(month_offset: int, amount: int) -> str:
 
 
 def process_freelance(month_offset: int, amount: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
+    now = add_months(get_current_time(), month_offset)
     target_month = now.strftime("%m/%Y")
     target_year = now.strftime("%Y")
     month_display = util.get_month_display(target_month, target_year)
     current_sheet = sheet.get_cached_worksheet(target_month)
 
     amount = amount * 1000
-    current_sheet.update_acell(const.FREELANCE_CELL, amount)
+    sheet.update_income_cells(current_sheet, {const.FREELANCE_CELL: amount})
 
     # Update config
     if month_offset == 0:
@@ -304,138 +324,60 @@ def process_freelance(month_offset: int, amount: int) -> str:
     return response
 
 
-def process_other_summary(month_offset: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
-    target_month = now.strftime("%m/%Y")
-    previous_month = (now - relativedelta(months=1)).strftime("%m/%Y")
-
-    logger.info(f"Getting other expenses for sheet {target_month}")
-
-    other_expenses, total = sheet.get_other_total(target_month)
-    count = len(other_expenses)
-    logger.info(f"Found {count} other expenses for this month with total {total} VND")
-
-    current_month = now.strftime("%m")
-    current_year = now.strftime("%Y")
-    month_display = util.get_month_display(current_month, current_year)
-
+# helper for per-day expense details
+def get_daily_details(expenses: list[sheet.Record]) -> str:
+    # Rows usually arrive in date order, so the day's list append is only
+    # looked up again when the date changes
     grouped = defaultdict(list)
-    for r in other_expenses:
-        date_str = r["date"]
-        grouped[date_str].append(r)
-
-    details = ""
+    last_day = None
+    for r in expenses:
+        day = r["date"]
+        if day != last_day:
+            add_row = grouped[day].append
+            last_day = day
+        add_row(r)
+
+    parts = []
+    # Bound once so the row loop avoids repeated global/attribute lookups
+    append = parts.append
+    format_expense = sheet.format_expense
     for day, rows in sorted(grouped.items()):
-        day_total = sum(sheet.parse_amount(r["vnd"]) for r in rows)
-        details += f"\n📅 {day}: {day_total:,.0f} VND\n"
+        day_total = sum(r["amount"] for r in rows)
+        append(f"\n📅 {day}: {day_total:,.0f} VND\n")
         for i, r in enumerate(rows, start=1):
-            details += sheet.format_expense(r, i) + "\n"
-
-    _, previous_total = sheet.get_other_total(previous_month)
-
-    # Calculate percentage change
-    if previous_total > 0:
-        percentage_change = ((total - previous_total) / previous_total) * 100
-        change_symbol = (
-            "📈" if percentage_change > 0 else "📉" if percentage_change < 0 else "➡️"
-        )
-        percentage_text = f" ({change_symbol} {percentage_change:+.1f}%)"
-    else:
-        percentage_text = ""
+            append(format_expense(r, i))
+            append("\n")
 
-    summary = (
-        f"{category_display['other']} {month_display}:\n"
-        f"{category_display['spend']}: {total:,.0f} VND\n"
-        f"{category_display['transaction']}: {count}\n"
-        f"{category_display['compare']} {previous_month}: {total - previous_total:+,.0f} VND {percentage_text}\n"
-    )
-
-    if details:
-        summary += f"\n📝 Chi tiết:{details}"
-
-    return summary
-
-
-def process_dating_summary(month_offset: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
-    target_month = now.strftime("%m/%Y")
-    previous_month = (now - relativedelta(months=1)).strftime("%m/%Y")
+    return "".join(parts)
 
-    logger.info(f"Getting dating expenses for sheet {target_month}")
 
-    dating_expenses, total = sheet.get_dating_total(target_month)
-    count = len(dating_expenses)
-    logger.info(f"Found {count} dating expenses for this month with total {total} VND")
-
-    current_month = now.strftime("%m")
-    current_year = now.strftime("%Y")
-    month_display = util.get_month_display(current_month, current_year)
-
-    grouped = defaultdict(list)
-    for r in dating_expenses:
-        date_str = r["date"]
-        grouped[date_str].append(r)
-
-    details = ""
-    for day, rows in sorted(grouped.items()):
-        day_total = sum(sheet.parse_amount(r["vnd"]) for r in rows)
-        details += f"\n📅 {day}: {day_total:,.0f} VND\n"
-        for i, r in enumerate(rows, start=1):
-            details += sheet.format_expense(r, i) + "\n"
+# helper for category summaries (gas, food, dating, other)
+async def process_category_summary(
+    category: str,
+    total_fn: Callable[[str], tuple[list[sheet.Record], int]],
+    month_offset: int,
+) -> str:
+    now = add_months(get_current_time(), month_offset)
+    target_month = month_sheet_name(now)
+    previous_month = month_sheet_name(add_months(now, -1))
 
-    _, previous_total = sheet.get_dating_total(previous_month)
+    logger.info(f"Getting {category} expenses for sheet {target_month}")
 
-    # Calculate percentage change
-    if previous_total > 0:
-        percentage_change = ((total - previous_total) / previous_total) * 100
-        change_symbol = (
-            "📈" if percentage_change > 0 else "📉" if percentage_change < 0 else "➡️"
-        )
-        percentage_text = f" ({change_symbol} {percentage_change:+.1f}%)"
-    else:
-        percentage_text = ""
-
-    summary = (
-        f"{category_display['dating']} {month_display}:\n"
-        f"{category_display['spend']}: {total:,.0f} VND\n"
-        f"{category_display['transaction']}: {count}\n"
-        f"{category_display['compare']} {previous_month}: {total - previous_total:+,.0f} VND {percentage_text}\n"
+    # Fetch this month and the previous month concurrently
+    (expenses, total), (_, previous_total) = await asyncio.gather(
+        asyncio.to_thread(total_fn, target_month),
+        asyncio.to_thread(sheet.get_total_if_sheet_exists, total_fn, previous_month),
+    )
+    count = len(expenses)
+    logger.info(
+        f"Found {count} {category} expenses for this month with total {total} VND"
     )
 
-    if details:
-        summary += f"\n📝 Chi tiết:{details}"
-
-    return summary
-
-
-def process_food_summary(month_offset: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
-    target_month = now.strftime("%m/%Y")
-    previous_month = (now - relativedelta(months=1)).strftime("%m/%Y")
-
-    logger.info(f"Getting food expenses for sheet {target_month}")
-
-    food_expenses, total = sheet.get_food_total(target_month)
-    count = len(food_expenses)
-    logger.info(f"Found {count} food expenses for this month with total {total} VND")
-
-    current_month = now.strftime("%m")
-    current_year = now.strftime("%Y")
+    current_month = f"{now.month:02d}"
+    current_year = str(now.year)
     month_display = util.get_month_display(current_month, current_year)
 
-    grouped = defaultdict(list)
-    for r in food_expenses:
-        date_str = r["date"]
-        grouped[date_str].append(r)
-
-    details = ""
-    for day, rows in sorted(grouped.items()):
-        day_total = sum(sheet.parse_amount(r["vnd"]) for r in rows)
-        details += f"\n📅 {day}: {day_total:,.0f} VND\n"
-        for i, r in enumerate(rows, start=1):
-            details += sheet.format_expense(r, i) + "\n"
-
-    _, previous_total = sheet.get_food_total(previous_month)
+    details = get_daily_details(expenses)
 
     # Calculate percentage change
     if previous_total > 0:
@@ -448,7 +390,7 @@ def process_food_summary(month_offset: int) -> str:
         percentage_text = ""
 
     summary = (
-        f"{category_display['food']} {month_display}:\n"
+        f"{category_display[category]} {month_display}:\n"
         f"{category_display['spend']}: {total:,.0f} VND\n"
         f"{category_display['transaction']}: {count}\n"
         f"{category_display['compare']} {previous_month}: {total - previous_total:+,.0f} VND {percentage_text}\n"
@@ -460,59 +402,26 @@ def process_food_summary(month_offset: int) -> str:
     return summary
 
 
-def process_gas_summary(month_offset: int) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
-    target_month = now.strftime("%m/%Y")
-    previous_month = (now - relativedelta(months=1)).strftime("%m/%Y")
+async def process_other_summary(month_offset: int) -> str:
+    return await process_category_summary("other", sheet.get_other_total, month_offset)
 
-    logger.info(f"Getting gas expenses for sheet {target_month}")
 
-    gas_expenses, total = sheet.get_gas_total(target_month)
-    count = len(gas_expenses)
-    logger.info(f"Found {count} gas expenses for this month with total {total} VND")
+async def process_dating_summary(month_offset: int) -> str:
+    return await process_category_summary(
+        "dating", sheet.get_dating_total, month_offset
+    )
 
-    current_month = now.strftime("%m")
-    current_year = now.strftime("%Y")
-    month_display = util.get_month_display(current_month, current_year)
 
-    grouped = defaultdict(list)
-    for r in gas_expenses:
-        grouped[r.get("Date", "")].append(r)
+async def process_food_summary(month_offset: int) -> str:
+    return await process_category_summary("food", sheet.get_food_total, month_offset)
 
-    details = ""
-    for day, rows in sorted(grouped.items()):
-        day_total = sum(sheet.parse_amount(r["vnd"]) for r in rows)
-        details += f"\n📅 {day}: {day_total:,.0f} VND\n"
-        for i, r in enumerate(rows, start=1):
-            details += sheet.format_expense(r, i) + "\n"
 
-    _, previous_total = sheet.get_gas_total(previous_month)
-
-    # Calculate percentage change
-    if previous_total > 0:
-        percentage_change = ((total - previous_total) / previous_total) * 100
-        change_symbol = (
-            "📈" if percentage_change > 0 else "📉" if percentage_change < 0 else "➡️"
-        )
-        percentage_text = f" ({change_symbol} {percentage_change:+.1f}%)"
-    else:
-        percentage_text = ""
-
-    summary = (
-        f"{category_display['gas']} {month_display}:\n"
-        f"{category_display['spend']}: {total:,.0f} VND\n"
-        f"{category_display['transaction']}: {count}\n"
-        f"{category_display['compare']} {previous_month}: {total - previous_total:+,.0f} VND {percentage_text}\n"
-    )
-
-    if details:
-        summary += f"\n📝 Chi tiết:{details}"
-
-    return summary
+async def process_gas_summary(month_offset: int) -> str:
+    return await process_category_summary("gas", sheet.get_gas_total, month_offset)
 
 
 def process_month_summary(month_offset: int = 0) -> str:
-    now = get_current_time() + relativedelta(months=month_offset)
+    now = add_months(get_current_time(), month_offset)
     target_month = now.strftime("%m/%Y")
 
     logger.info(f"Getting month expenses for sheet {target_month}")
@@ -528,8 +437,8 @@ def process_month_summary(month_offset: int = 0) -> str:
         exit(1)
 
     try:
-        all_values = sheet.get_cached_sheet_data(target_month)
-        logger.info(f"Retrieved {len(all_values)} records from sheet")
+        records = sheet.get_month_records(target_month)
+        logger.info(f"Retrieved {len(records)} records from sheet")
     except Exception as records_error:
         logger.error(
             f"Error retrieving records from sheet: {records_error}",
@@ -537,7 +446,6 @@ def process_month_summary(month_offset: int = 0) -> str:
         )
         exit(1)
 
-    records = sheet.convert_values_to_records(all_values)
     response = get_month_response(records, current_sheet, now)
     return response
 
@@ -551,22 +459,21 @@ async def process_week_summary(week_offset: int = 0) -> str:
     week_start = week_data["week_start"]
     week_end = week_data["week_end"]
 
+    # Group by the already parsed day so sorting needs no date parsing
     grouped = defaultdict(list)
     for r in week_expenses:
-        date_str = r["expense_date"].strftime("%d/%m/%Y")
-        grouped[date_str].append(r)
-
-    details_lines = []
-    for day, rows in sorted(
-        grouped.items(),
-        key=lambda d: datetime.datetime.strptime(d[0], "%d/%m/%Y"),
-    ):
-        day_total = sum(sheet.parse_amount(r["vnd"]) for r in rows)
-        details_lines.append(f"\n📅 {day}: {day_total:,.0f} VND")
-        details_lines.extend(
-            "\n" + sheet.format_expense(r, i) for i, r in enumerate(rows, start=1)
+        grouped[r["expense_date"]].append(r)
+
+    # One flat list of lines per day (header, expenses, blank), joined once
+    details_lines = [
+        line
+        for day, rows in sorted(grouped.items())
+        for line in (
+            f"📅 {day:%d/%m/%Y}: {sum(r['amount'] for r in rows):,.0f} VND",
+            *[sheet.format_expense(r, i) for i, r in enumerate(rows, start=1)],
+            "",
         )
-        details_lines.append("\n")
+    ]
 
     summay = (
         f"{category_display['summarized']} tuần này ({week_start:%d/%m} - {week_end:%d/%m}):\n"
@@ -575,7 +482,7 @@ async def process_week_summary(week_offset: int = 0) -> str:
     )
 
     if details_lines:
-        summay += f"\n📝 Chi tiết:{''.join(details_lines)}"
+        summay += "\n📝 Chi tiết:\n" + "\n".join(details_lines)
 
     return summay
 
@@ -603,46 +510,47 @@ async def process_today_summary() -> str:
     return summary
 
 
-def get_investment_response(month_offset: int = 0) -> str:
-    now = sheet.get_current_time() + relativedelta(months=month_offset)
-    target_month = now.strftime("%m/%Y")
-    previous_month = (now - relativedelta(months=1)).strftime("%m/%Y")
+async def get_investment_response(month_offset: int = 0) -> str:
+    now = add_months(sheet.get_current_time(), month_offset)
+    target_month = month_sheet_name(now)
+    previous_month = month_sheet_name(add_months(now, -1))
 
     logger.info(f"Getting investment expenses for sheet {target_month}")
 
-    try:
-        current_sheet = sheet.get_cached_worksheet(target_month)
-        logger.info(f"Successfully obtained sheet for {target_month}")
-    except Exception as sheet_error:
+    # Fetch the sheet and both months' totals concurrently
+    current_sheet, current_result, previous_result = await asyncio.gather(
+        asyncio.to_thread(sheet.get_cached_worksheet, target_month),
+        asyncio.to_thread(sheet.get_investment_total, target_month),
+        asyncio.to_thread(
+            sheet.get_total_if_sheet_exists, sheet.get_investment_total, previous_month
+        ),
+        return_exceptions=True,
+    )
+
+    if isinstance(current_sheet, Exception):
         logger.error(
-            f"Error getting/creating sheet {target_month}: {sheet_error}",
-            exc_info=True,
+            f"Error getting/creating sheet {target_month}: {current_sheet}",
+            exc_info=current_sheet,
         )
         exit(1)
+    logger.info(f"Successfully obtained sheet for {target_month}")
 
-    investment_expenses, total = sheet.get_investment_total(target_month)
+    for result in (current_result, previous_result):
+        if isinstance(result, Exception):
+            raise result
+
+    investment_expenses, total = current_result
+    _, previous_total = previous_result
     count = len(investment_expenses)
     logger.info(
         f"Found {count} investment expenses for this month with total {total} VND"
     )
 
-    current_month = now.strftime("%m")
-    current_year = now.strftime("%Y")
+    current_month = f"{now.month:02d}"
+    current_year = str(now.year)
     month_display = util.get_month_display(current_month, current_year)
 
-    grouped = defaultdict(list)
-    for r in investment_expenses:
-        date_str = r["date"]
-        grouped[date_str].append(r)
-
-    details = ""
-    for day, rows in sorted(grouped.items()):
-        day_total = sum(sheet.parse_amount(r["vnd"]) for r in rows)
-        details += f"\n📅 {day}: {day_total:,.0f} VND\n"
-        for i, r in enumerate(rows, start=1):
-            details += sheet.format_expense(r, i) + "\n"
-
-    _, previous_total = sheet.get_investment_total(previous_month)
+    details = get_daily_details(investment_expenses)
 
     # Calculate percentage change
     if previous_total > 0:
@@ -654,12 +562,13 @@ def get_investment_response(month_offset: int = 0) -> str:
     else:
         percentage_text = ""
 
-    # Get income from sheet
-    total_income = sheet.get_total_income(current_sheet)
-    long_invest_budget = sheet.get_category_percentage(current_sheet, const.LONG_INVEST)
-    opportunity_invest_budget = sheet.get_category_percentage(
-        current_sheet, const.OPPORTUNITY_INVEST
+    # Get income and budget percentages from sheet
+    total_income, cat_percentage = await asyncio.gather(
+        asyncio.to_thread(sheet.get_total_income, current_sheet),
+        asyncio.to_thread(sheet.get_category_percentages_by_sheet, current_sheet),
     )
+    long_invest_budget = cat_percentage[const.LONG_INVEST] / 100
+    opportunity_invest_budget = cat_percentage[const.OPPORTUNITY_INVEST] / 100
     long_invest_estimate = total_income * long_invest_budget if total_income > 0 else 0
     opportunity_invest_estimate = (
         total_income * opportunity_invest_budget if total_income > 0 else 0
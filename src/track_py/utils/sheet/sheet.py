@@ -1,12 +1,15 @@
 import os
+import functools
+import random
 import gspread
 import time
 import re
 import asyncio
 import datetime
-from dateutil.relativedelta import relativedelta
 from google.oauth2.service_account import Credentials
-from gspread.utils import a1_to_rowcol
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from gspread.utils import a1_to_rowcol, absolute_range_name
 from src.track_py.utils.logger import logger
 from src.track_py.utils.timezone import get_current_time
 from src.track_py.config import config, PROJECT_ROOT
@@ -14,8 +17,8 @@ from src.track_py.utils.logger import logger
 import src.track_py.const as const
 import src.track_py.utils.util as util
 from src.track_py.utils.category import category_display
-from src.track_py.utils.datetime import parse_date_time
-from typing import TypedDict
+from src.track_py.utils.datetime import parse_date_time, add_months
+from typing import Callable, TypedDict
 from huggingface_hub import InferenceClient
 from src.track_py.utils.util import markdown_to_html
 from src.track_py.config import config, save_config
@@ -23,31 +26,47 @@ from collections import defaultdict
 import src.track_py.utils.sheet as sheet
 
 
-# Google Sheets setup
-try:
-    scope = config["google_sheets"]["scopes"]
-    credentials_path = os.path.join(
-        PROJECT_ROOT, config["google_sheets"]["credentials_file"]
-    )
-    creds = Credentials.from_service_account_file(credentials_path, scopes=scope)
-    client = gspread.authorize(creds)
+# Connection pool size for the shared Google Sheets session, sized for the
+# concurrent to_thread reads (e.g. week spanning months, dashboard gather)
+_http_pool_size = 16
 
-    # Open the specific Google Sheet by ID from the URL
-    spreadsheet = client.open_by_key(config["google_sheets"]["spreadsheet_id"])
-    logger.info(
-        f"Google Sheets connected successfully using credentials from {credentials_path}"
-    )
-except Exception as e:
-    logger.error(f"Failed to connect to Google Sheets: {e}")
-    print("⚠️  Please make sure you have:")
-    print(
-        f"1. Created {config['google_sheets']['credentials_file']} file in {PROJECT_ROOT}"
-    )
-    print(
-        f"2. Shared the Google Sheet (ID: {config['google_sheets']['spreadsheet_id']}) with your service account email"
-    )
-    print("3. The sheet has the correct permissions")
-    exit(1)
+
+# Google Sheets setup, authorized lazily on first use
+@functools.lru_cache(maxsize=1)
+def get_spreadsheet() -> gspread.Spreadsheet:
+    """Authorize and open the configured spreadsheet once per process"""
+    try:
+        scope = config["google_sheets"]["scopes"]
+        credentials_path = os.path.join(
+            PROJECT_ROOT, config["google_sheets"]["credentials_file"]
+        )
+        creds = Credentials.from_service_account_file(credentials_path, scopes=scope)
+
+        # Share one pooled session so concurrent calls reuse TLS connections
+        session = AuthorizedSession(creds)
+        adapter = HTTPAdapter(
+            pool_connections=_http_pool_size, pool_maxsize=_http_pool_size
+        )
+        session.mount("https://", adapter)
+        client = gspread.Client(creds, session=session)
+
+        # Open the specific Google Sheet by ID from the URL
+        spreadsheet = client.open_by_key(config["google_sheets"]["spreadsheet_id"])
+        logger.info(
+            f"Google Sheets connected successfully using credentials from {credentials_path}"
+        )
+        return spreadsheet
+    except Exception as e:
+        logger.error(f"Failed to connect to Google Sheets: {e}")
+        print("⚠️  Please make sure you have:")
+        print(
+            f"1. Created {config['google_sheets']['credentials_file']} file in {PROJECT_ROOT}"
+        )
+        print(
+            f"2. Shared the Google Sheet (ID: {config['google_sheets']['spreadsheet_id']}) with your service account email"
+        )
+        print("3. The sheet has the correct permissions")
+        raise
 
 
 class Record(TypedDict):
@@ -55,6 +74,7 @@ class Record(TypedDict):
     time: str
     vnd: int
     note: str
+    amount: int  # vnd parsed once by convert_values_to_records
 
 
 def get_monthly_sheet_if_exists(target_month: str) -> gspread.Worksheet | None:
@@ -65,7 +85,7 @@ def get_monthly_sheet_if_exists(target_month: str) -> gspread.Worksheet | None:
 
         # Try to get existing sheet
         try:
-            current_sheet = spreadsheet.worksheet(sheet_name)
+            current_sheet = sheet.get_worksheet_by_name(sheet_name)
             logger.debug(f"Found existing sheet: {sheet_name}")
             return current_sheet
         except gspread.WorksheetNotFound:
@@ -83,6 +103,17 @@ def get_monthly_sheet_if_exists(target_month: str) -> gspread.Worksheet | None:
         return None
 
 
+# helper for previous-month comparisons
+def get_total_if_sheet_exists(
+    total_fn: Callable[[str], tuple[list[Record], int]], target_month: str
+) -> tuple[list[Record], int]:
+    """Run a month total only if its sheet exists, so reads never create sheets"""
+    if get_monthly_sheet_if_exists(target_month) is None:
+        logger.info(f"Sheet {target_month} does not exist, using a total of 0")
+        return [], 0
+    return total_fn(target_month)
+
+
 def get_or_create_monthly_sheet(target_month=None) -> gspread.Worksheet:
     """Get month's sheet or create a new one for target month"""
     try:
@@ -98,7 +129,7 @@ def get_or_create_monthly_sheet(target_month=None) -> gspread.Worksheet:
 
         # Try to get existing sheet
         try:
-            current_sheet = spreadsheet.worksheet(sheet_name)
+            current_sheet = sheet.get_worksheet_by_name(sheet_name)
             logger.info(f"Using existing sheet: {sheet_name}")
             return current_sheet
         except gspread.WorksheetNotFound:
@@ -107,24 +138,33 @@ def get_or_create_monthly_sheet(target_month=None) -> gspread.Worksheet:
             try:
                 # Try to copy from template sheet
                 try:
-                    template_sheet = spreadsheet.worksheet(
+                    template_sheet = sheet.get_worksheet_by_name(
                         config["settings"]["template_sheet_name"]
                     )
                     logger.info(
                         f"Found template sheet: {config['settings']['template_sheet_name']}"
                     )
 
-                    # Create new sheet by duplicating the template
-                    new_sheet = template_sheet.duplicate(new_sheet_name=sheet_name)
-                    logger.info(f"Duplicated template sheet to create: {sheet_name}")
-
+                    # Create new sheet by duplicating the template and writing
+                    # config in the same request
                     try:
-                        sheet.update_config_to_sheet(new_sheet)
+                        new_sheet = duplicate_sheet_with_config(
+                            template_sheet, sheet_name
+                        )
+                        logger.info(
+                            f"Duplicated template sheet with config to create: {sheet_name}"
+                        )
                     except Exception as e:
-                        logger.error(
-                            f"Error updating config to new sheet {sheet_name}: {e}",
-                            exc_info=True,
+                        logger.warning(
+                            f"Single-request duplicate failed for {sheet_name}, retrying in two steps: {e}"
+                        )
+                        new_sheet = template_sheet.duplicate(new_sheet_name=sheet_name)
+                        logger.info(
+                            f"Duplicated template sheet to create: {sheet_name}"
                         )
+                        sheet.update_config_to_sheet(new_sheet)
+
+                    sheet.add_worksheet_to_cache(new_sheet)
 
                     logger.info(f"Created new sheet from template: {sheet_name}")
                     return new_sheet
@@ -134,9 +174,10 @@ def get_or_create_monthly_sheet(target_month=None) -> gspread.Worksheet:
                         f"Template sheet '{config['settings']['template_sheet_name']}' not found, creating basic sheet"
                     )
                     # Create a basic sheet if template doesn't exist
-                    new_sheet = spreadsheet.add_worksheet(
+                    new_sheet = get_spreadsheet().add_worksheet(
                         title=sheet_name, rows="100", cols="10"
                     )
+                    sheet.add_worksheet_to_cache(new_sheet)
 
                     # Add basic headers
                     headers = ["Date", "Time", "VND", "Note"]
@@ -156,7 +197,7 @@ def get_or_create_monthly_sheet(target_month=None) -> gspread.Worksheet:
                 )
                 # Fallback to first available sheet
                 logger.warning("Falling back to default sheet")
-                return spreadsheet.sheet1
+                return get_spreadsheet().sheet1
         except Exception as worksheet_error:
             logger.error(
                 f"Error accessing worksheet {sheet_name}: {worksheet_error}",
@@ -169,7 +210,7 @@ def get_or_create_monthly_sheet(target_month=None) -> gspread.Worksheet:
         # Fallback to default sheet
         logger.warning("Falling back to default sheet due to error")
         try:
-            return spreadsheet.sheet1
+            return get_spreadsheet().sheet1
         except Exception as fallback_error:
             logger.error(
                 f"Even fallback to sheet1 failed: {fallback_error}", exc_info=True
@@ -189,7 +230,7 @@ def get_monthly_expense(sheet_name: str) -> int:
                 total_cell_value = current_sheet.acell(const.TOTAL_EXPENSE_CELL).value
                 if total_cell_value:
                     # Parse the amount (remove currency symbols, commas, etc.)
-                    total = sheet.sheet.parse_amount(total_cell_value)
+                    total = sheet.parse_amount(total_cell_value)
             except Exception as cell_error:
                 logger.warning(
                     f"Could not read G2 from sheet {sheet_name}: {cell_error}"
@@ -210,58 +251,50 @@ async def get_week_process_data(time_with_offset: datetime.datetime) -> dict:
 
     logger.info(f"Getting week expenses from {week_start:%d/%m} to {week_end:%d/%m}")
 
-    # Collect all months the week spans
-    months_to_check = sorted(
-        {(week_start + datetime.timedelta(days=i)).strftime("%m/%Y") for i in range(7)},
-        key=lambda s: datetime.datetime.strptime(s, "%m/%Y"),
+    # The 7 days of the week, already at midnight in the week's timezone
+    week_days = [week_start + datetime.timedelta(days=i) for i in range(7)]
+
+    # A week spans at most two months: the ones it starts and ends in
+    start_month = week_start.strftime("%m/%Y")
+    end_month = week_end.strftime("%m/%Y")
+    months_to_check = (
+        [start_month] if start_month == end_month else [start_month, end_month]
     )
 
     week_expenses = []
     total = 0.0
-    week_records = []
 
     tasks = [
-        asyncio.to_thread(sheet.get_cached_sheet_data, month)
+        asyncio.to_thread(sheet.get_cached_date_index, month)
         for month in months_to_check
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Process each relevant sheet
-    for target_month, all_values in zip(months_to_check, results):
+    for target_month, result in zip(months_to_check, results):
         try:
-            records = sheet.convert_values_to_records(all_values)
-            year = target_month.split("/")[1]
-            for r in records:
-                raw_date = r["date"].strip()
-                raw_amount = r["vnd"]
-
-                if not raw_date or not raw_amount:
+            if isinstance(result, Exception):
+                raise result
+            columns, date_index = result
+            amounts = columns["amounts"]
+            year = int(target_month.split("/")[1])
+
+            # Look the week's days up in the cached date index, so only rows
+            # inside the week are touched; each day already carries the
+            # week's timezone
+            for day in week_days:
+                if day.year != year:
                     continue
-
-                try:
-                    # Parse dd/mm with inferred year
-                    if "/" not in raw_date:
-                        continue
-                    day, month = raw_date.split("/")[:2]
-                    date_obj = datetime.datetime.strptime(
-                        f"{day}/{month}/{year}", "%d/%m/%Y"
-                    )
-                    expense_date = date_obj.replace(tzinfo=week_start.tzinfo)
-
-                    if week_start <= expense_date <= week_end:
-                        amount = sheet.parse_amount(raw_amount)
-                        if amount == 0:
-                            continue
-                        r["expense_date"] = expense_date
-                        week_expenses.append(r)
-                        total += amount
-                        week_records.append(r)
-                except Exception as e:
-                    logger.debug(
-                        f"Skipping invalid date {raw_date} in {target_month}: {e}"
-                    )
+                indices = date_index.get(day.strftime("%d/%m"))
+                if not indices:
                     continue
 
+                records = sheet.columns_to_records(columns, indices)
+                for r in records:
+                    r["expense_date"] = day
+                week_expenses.extend(records)
+                total += sum(amounts[i] for i in indices)
+
         except Exception as sheet_error:
             logger.warning(f"Could not access sheet {target_month}: {sheet_error}")
             continue
@@ -275,7 +308,7 @@ async def get_week_process_data(time_with_offset: datetime.datetime) -> dict:
         "week_expenses": week_expenses,
         "week_start": week_start,
         "week_end": week_end,
-        "records": week_records,
+        "records": week_expenses,
     }
 
 
@@ -288,51 +321,40 @@ async def get_daily_process_data(time_with_offset: datetime.datetime) -> dict:
     logger.info(f"Getting today's expenses for {today_str} in sheet {target_month}")
 
     try:
-        # Use optimized today data fetching with shorter cache
-        all_values = await asyncio.to_thread(
-            sheet.get_cached_today_data, target_month, today_str
+        # Use optimized today data fetching with shorter cache, indexed by date;
+        # record dicts are built only for today's rows
+        today_rows = await asyncio.to_thread(
+            sheet.get_cached_records_for_date, target_month, today_str
         )
-        logger.info(f"Retrieved {len(all_values)} rows from sheet (today cache)")
+        logger.info(f"Retrieved {len(today_rows)} rows for today (today cache)")
     except Exception as sheet_error:
         logger.error(
             f"Error getting sheet data for {target_month}: {sheet_error}", exc_info=True
         )
         return
 
-    today_expenses = []
-    total = 0
-    today_records = []
-    records = sheet.convert_values_to_records(all_values)
-    for r in records:
-        record_date = r["date"].strip().lstrip("'")
-        if record_date and record_date > today_str:
-            continue
-
-        if record_date == today_str:
-            record_amount = r["vnd"]
-            amount = sheet.parse_amount(record_amount)
-            if amount > 0:  # Only include records with valid amounts
-                today_expenses.append(r)
-                total += amount
-                today_records.append(r)
+    # Only include records with valid amounts
+    today_expenses = [r for r in today_rows if r["amount"] > 0]
+    total = sum(r["amount"] for r in today_expenses)
 
     count = len(today_expenses)
     logger.info(f"Found {count} expenses for today with total {total} VND")
     logger.info(
-        f"Today date string: '{today_str}', Rows processed: {len(all_values)}"
+        f"Today date string: '{today_str}', Rows for today: {len(today_rows)}"
     )  # Debug info
 
     return {
         "total": total,
         "today_expenses": today_expenses,
         "date_str": today_str,
-        "records": today_records,
+        "records": today_expenses,
     }
 
 
-# helper for month budget
-async def get_month_budget(month: str) -> int:
-    current_sheet = await asyncio.to_thread(sheet.get_cached_worksheet, month)
+# helper for month budget, memoized until config or income cells change
+@functools.lru_cache(maxsize=32)
+def _get_month_budget_cached(month: str, config_version: int) -> int:
+    current_sheet = sheet.get_cached_worksheet(month)
 
     # Get income from sheet
     salary = current_sheet.acell(const.SALARY_CELL).value
@@ -352,6 +374,12 @@ async def get_month_budget(month: str) -> int:
     return month_budget
 
 
+async def get_month_budget(month: str) -> int:
+    return await asyncio.to_thread(
+        _get_month_budget_cached, month, sheet.get_config_version()
+    )
+
+
 # helper for month budget by sheet
 def get_month_budget_by_sheet(current_sheet: gspread.Worksheet) -> int:
     # Get income from sheet
@@ -374,10 +402,42 @@ def get_month_budget_by_sheet(current_sheet: gspread.Worksheet) -> int:
     return salary + freelance
 
 
-# helper for month budget percentages
+# helper for month budget percentages, memoized until config changes
+@functools.lru_cache(maxsize=32)
+def _get_category_percentages_cached(sheet_name: str, config_version: int) -> dict:
+    current_sheet = sheet.get_cached_worksheet(sheet_name)
+    return _read_category_percentages(current_sheet)
+
+
 async def get_category_percentages_by_sheet_name(sheet_name: str) -> dict:
-    current_sheet = await asyncio.to_thread(sheet.get_cached_worksheet, sheet_name)
-    cat_percentage = get_category_percentages_by_sheet(current_sheet)
+    try:
+        cat_percentage = await asyncio.to_thread(
+            _get_category_percentages_cached, sheet_name, sheet.get_config_version()
+        )
+        return dict(cat_percentage)
+    except Exception as e:
+        logger.error(f"Error fetching category percentages for {sheet_name}: {e}")
+        return {
+            cat: config["budgets"].get(cat, 0) for cat in const.CATEGORY_CELLS.keys()
+        }
+
+
+def _read_category_percentages(current_sheet: gspread.Worksheet) -> dict:
+    """Read all category percentages from L2:Q2, raising on API errors"""
+    cell_range = "L2:Q2"
+    result = current_sheet.get(cell_range)
+    row = result[0] if result else []
+    categories = list(const.CATEGORY_CELLS.keys())
+    cat_percentage = {}
+
+    for i, category in enumerate(categories):
+        # cells are formatted as percentages, e.g. "10%"
+        raw_value = str(row[i]).strip().rstrip("%") if i < len(row) else ""
+        if not raw_value.isdigit():
+            cat_percentage[category] = config["budgets"].get(category, 0)
+        else:
+            cat_percentage[category] = int(raw_value)
+
     return cat_percentage
 
 
@@ -388,20 +448,7 @@ def get_category_percentages_by_sheet(current_sheet: gspread.Worksheet) -> dict:
     """
 
     try:
-        cell_range = "L2:Q2"
-        result = current_sheet.get(cell_range)
-        row = result[0] if result else []
-        categories = list(const.CATEGORY_CELLS.keys())
-        cat_percentage = {}
-
-        for i, category in enumerate(categories):
-            raw_value = row[i] if i < len(row) else None
-            if not raw_value or not str(raw_value).strip().isdigit():
-                cat_percentage[category] = config["budgets"].get(category, 0)
-            else:
-                cat_percentage[category] = int(raw_value)
-
-        return cat_percentage
+        return _read_category_percentages(current_sheet)
 
     except Exception as e:
         logger.error(f"Error fetching category percentages: {e}")
@@ -411,23 +458,11 @@ def get_category_percentages_by_sheet(current_sheet: gspread.Worksheet) -> dict:
         }
 
 
-# helper for get percentage spend for a category
-def get_category_percentage(current_sheet: gspread.Worksheet, category: str) -> float:
-    cell = const.CATEGORY_CELLS.get(category)
-    percentage = current_sheet.acell(
-        cell, value_render_option="UNFORMATTED_VALUE"
-    ).value
-    if not percentage:
-        percentage = config["budgets"].get(category, 0)
-
-    return float(percentage)
-
-
 # helper for sync config command
 def sync_config_to_sheet() -> str:
     """Helper to sync config to sheet for a next month"""
     # next month
-    now = get_current_time() + relativedelta(months=1)
+    now = add_months(get_current_time(), 1)
     target_month = now.strftime("%m")
     year = now.strftime("%Y")
     month_display = util.get_month_display(target_month, year)
@@ -445,37 +480,50 @@ def sync_config_to_sheet() -> str:
         return f"{category_display['sync']} cấu hình {month_display} thất bại!"
 
 
+# helper for config values written to a month sheet
+def get_config_cell_values() -> tuple[dict[str, int], dict[str, int | float]]:
+    """Get (income cells, category percentage cells) mapped to config values"""
+    income_cells = {
+        const.SALARY_CELL: config["income"]["salary"],
+        const.FREELANCE_CELL: config["income"]["freelance"],
+    }
+    percent_cells = {
+        const.CATEGORY_CELLS[category]: percent
+        for category, percent in config["budgets"].items()
+        if category in const.CATEGORY_CELLS
+    }
+    return income_cells, percent_cells
+
+
 # helper for update config to sheet
 def update_config_to_sheet(current_sheet: gspread.Worksheet):
     """Helper to update config to sheet for a given month"""
     try:
-        cells_to_update = []
-        salary_income = config["income"]["salary"]
-        row, col = a1_to_rowcol(const.SALARY_CELL)
-        cells_to_update.append(gspread.Cell(row=row, col=col, value=salary_income))
-
-        freelance_income = config["income"]["freelance"]
-        row, col = a1_to_rowcol(const.FREELANCE_CELL)
-        cells_to_update.append(gspread.Cell(row=row, col=col, value=freelance_income))
+        income_cells, percent_cells = get_config_cell_values()
+        data = [
+            {
+                "range": absolute_range_name(current_sheet.title, cell),
+                "values": [[value]],
+            }
+            for cell, value in income_cells.items()
+        ]
 
         # write category percentages from config
-        for category in config["budgets"]:
-            if category not in const.CATEGORY_CELLS:
-                continue
-
-            cell = const.CATEGORY_CELLS[category]
-            percent = f"{config['budgets'][category]}%"
-            logger.info(
-                f"Updating category {category} percentage to {percent} in cell {cell}"
+        for cell, percent in percent_cells.items():
+            logger.info(f"Updating category percentage to {percent}% in cell {cell}")
+            data.append(
+                {
+                    "range": absolute_range_name(current_sheet.title, cell),
+                    "values": [[f"{percent}%"]],
+                }
             )
-            row, col = a1_to_rowcol(cell)
-            cells_to_update.append(gspread.Cell(row=row, col=col, value=percent))
 
-        # update cells in batch to reduce API calls
-        if cells_to_update:
-            current_sheet.update_cells(
-                cells_to_update, value_input_option="USER_ENTERED"
-            )
+        # update all cells in a single API call
+        get_spreadsheet().values_batch_update(
+            {"valueInputOption": "USER_ENTERED", "data": data}
+        )
+        sheet.invalidate_income_cache(current_sheet.id)
+        sheet.bump_config_version()
 
     except Exception as e:
         logger.error(
@@ -484,36 +532,95 @@ def update_config_to_sheet(current_sheet: gspread.Worksheet):
         )
 
 
+# helper for creating a month sheet from the template
+def duplicate_sheet_with_config(
+    template_sheet: gspread.Worksheet, sheet_name: str
+) -> gspread.Worksheet:
+    """Duplicate the template and write config values in one batchUpdate request"""
+    spreadsheet = get_spreadsheet()
+    new_sheet_id = random.randint(1, 2**31 - 1)
+    requests = [
+        {
+            "duplicateSheet": {
+                "sourceSheetId": template_sheet.id,
+                "newSheetId": new_sheet_id,
+                "newSheetName": sheet_name,
+            }
+        }
+    ]
+
+    income_cells, percent_cells = get_config_cell_values()
+    for cell, value in {**income_cells, **percent_cells}.items():
+        row, col = a1_to_rowcol(cell)
+        cell_data = {"userEnteredValue": {"numberValue": value}}
+        fields = "userEnteredValue"
+        if cell in percent_cells:
+            pattern = "0%" if float(value).is_integer() else "0.00%"
+            cell_data = {
+                "userEnteredValue": {"numberValue": value / 100},
+                "userEnteredFormat": {
+                    "numberFormat": {"type": "PERCENT", "pattern": pattern}
+                },
+            }
+            fields = "userEnteredValue,userEnteredFormat.numberFormat"
+
+        requests.append(
+            {
+                "updateCells": {
+                    "rows": [{"values": [cell_data]}],
+                    "fields": fields,
+                    "start": {
+                        "sheetId": new_sheet_id,
+                        "rowIndex": row - 1,
+                        "columnIndex": col - 1,
+                    },
+                }
+            }
+        )
+
+    response = spreadsheet.batch_update({"requests": requests})
+    properties = response["replies"][0]["duplicateSheet"]["properties"]
+    try:
+        return gspread.Worksheet(
+            spreadsheet, properties, spreadsheet.id, spreadsheet.client
+        )
+    except TypeError:
+        # gspread < 6 takes only (spreadsheet, properties)
+        return gspread.Worksheet(spreadsheet, properties)
+
+
+# helper for sorting data rows by date/time and formatting their amounts
+def _sort_rows(data_rows: list[list]) -> list[list]:
+    sorted_data = sorted(data_rows, key=parse_date_time)
+
+    # format amounts VND
+    sheet.normalize_amount_column(sorted_data)
+    return sorted_data
+
+
 async def sort_expenses_by_date(month_offset: int = 0) -> str:
     """Helper to sort expenses in a given month sheet by date"""
     try:
-        now = get_current_time() + relativedelta(months=month_offset)
+        now = add_months(get_current_time(), month_offset)
         target_month = now.strftime("%m/%Y")
         sheet_name = target_month
         current_sheet = await asyncio.to_thread(sheet.get_cached_worksheet, sheet_name)
 
-        # Get all data
-        all_values = await asyncio.to_thread(sheet.get_cached_sheet_data, sheet_name)
+        # Get fresh data, the sorted rows overwrite the whole range
+        all_values = await asyncio.to_thread(
+            sheet.get_cached_sheet_data, sheet_name, True
+        )
 
         if len(all_values) > 2:  # More than header + 1 row
-            data_rows = all_values[1:]
-            sorted_data = sorted(data_rows, key=parse_date_time)
-
-            # format amounts VND
-            for row in sorted_data:
-                if len(row) >= 3 and row[2]:
-                    try:
-                        row[2] = int(
-                            float(str(row[2]).replace(",", "").replace("₫", "").strip())
-                        )
-                    except (ValueError, TypeError):
-                        pass
+            # Sort and clean off the event loop
+            sorted_data = await asyncio.to_thread(_sort_rows, all_values[1:])
 
             # Update the sorted data
             await asyncio.to_thread(
-                lambda: current_sheet.update(
-                    f"A2:D{len(sorted_data) + 1}", sorted_data, value_input_option="RAW"
-                )
+                current_sheet.update,
+                f"A2:D{len(sorted_data) + 1}",
+                sorted_data,
+                value_input_option="RAW",
             )
 
             # Invalidate cache
@@ -534,33 +641,26 @@ async def sort_expenses_by_date(month_offset: int = 0) -> str:
 async def sort_assets_expenses_by_date(month_offset: int = 0) -> str:
     """Helper to sort expenses in a given month sheet by date"""
     try:
-        now = get_current_time() + relativedelta(months=month_offset)
+        now = add_months(get_current_time(), month_offset)
         target_month = now.strftime("%m/%Y")
         sheet_name = target_month
         current_sheet = await asyncio.to_thread(sheet.get_cached_worksheet, sheet_name)
 
-        # Get all data
-        all_values = await asyncio.to_thread(sheet.get_cached_sheet_data, sheet_name)
+        # Get fresh data, the sorted rows overwrite the whole range
+        all_values = await asyncio.to_thread(
+            sheet.get_cached_sheet_data, sheet_name, True
+        )
 
         if len(all_values) > 2:  # More than header + 1 row
-            data_rows = all_values[1:]
-            sorted_data = sorted(data_rows, key=parse_date_time)
-
-            # format amounts VND
-            for row in sorted_data:
-                if len(row) >= 3 and row[2]:
-                    try:
-                        row[2] = int(
-                            float(str(row[2]).replace(",", "").replace("₫", "").strip())
-                        )
-                    except (ValueError, TypeError):
-                        pass
+            # Sort and clean off the event loop
+            sorted_data = await asyncio.to_thread(_sort_rows, all_values[1:])
 
             # Update the sorted data
             await asyncio.to_thread(
-                lambda: current_sheet.update(
-                    f"A2:E{len(sorted_data) + 1}", sorted_data, value_input_option="RAW"
-                )
+                current_sheet.update,
+                f"A2:E{len(sorted_data) + 1}",
+                sorted_data,
+                value_input_option="RAW",
             )
 
             # Invalidate cache
@@ -578,25 +678,63 @@ async def sort_assets_expenses_by_date(month_offset: int = 0) -> str:
         return "Đã xảy ra lỗi khi sắp xếp dữ liệu."
 
 
+# helper for month columns shared by the category totals
+def get_month_columns(month: str) -> dict[str, list]:
+    """Fetch cached month data as parallel columns (notes already lowercased)"""
+    # Use cached data for read-only operations
+    return sheet.get_cached_sheet_columns(month)
+
+
+# helper for month records shared by summaries that total every category
+def get_month_records(month: str) -> list[Record]:
+    """Fetch cached month data and convert it to records once"""
+    return sheet.columns_to_records(get_month_columns(month))
+
+
+def get_keyword_total_from_columns(
+    columns: dict[str, list], keywords: list[str]
+) -> tuple[list[Record], int]:
+    """Helper to get expenses and total of rows matching any keyword"""
+    amounts = columns["amounts"]
+    matches = [
+        i
+        for i, note in enumerate(columns["notes_lower"])
+        if amounts[i] and sheet.has_keyword(note, keywords)
+    ]
+    total = sum(amounts[i] for i in matches)
+    return sheet.columns_to_records(columns, matches), total
+
+
+# helper for month keyword totals, memoized until the month data changes
+def get_month_keyword_total(
+    month: str, keywords: list[str]
+) -> tuple[list[Record], int]:
+    """Helper to get expenses and total of a month's rows matching any keyword"""
+    return sheet.get_cached_category_total(
+        month,
+        tuple(keywords),
+        lambda columns: get_keyword_total_from_columns(columns, keywords),
+    )
+
+
+def get_other_total_from_columns(
+    columns: dict[str, list],
+) -> tuple[list[Record], int]:
+    """Helper to get expenses and total of rows matching no known category"""
+    amounts = columns["amounts"]
+    matches = [
+        i
+        for i, note in enumerate(columns["notes_lower"])
+        if amounts[i] and not sheet.get_note_categories(note)
+    ]
+    total = sum(amounts[i] for i in matches)
+    return sheet.columns_to_records(columns, matches), total
+
+
 def get_gas_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total gas expenses for a given month"""
     try:
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        gas_expenses = []
-        total = 0
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(note, const.TRANSPORT_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    gas_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return gas_expenses, total
+        return get_month_keyword_total(month, const.TRANSPORT_KEYWORDS)
     except Exception as e:
         logger.error(f"Error getting gas total for {month}: {e}", exc_info=True)
         return [], 0
@@ -606,22 +744,7 @@ def get_gas_total(month: str) -> tuple[list[Record], int]:
 def get_food_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total food expenses for a given month"""
     try:
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        food_expenses = []
-        total = 0
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(note, const.FOOD_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    food_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return food_expenses, total
+        return get_month_keyword_total(month, const.FOOD_KEYWORDS)
     except Exception as e:
         logger.error(f"Error getting food total for {month}: {e}", exc_info=True)
         return [], 0
@@ -631,23 +754,7 @@ def get_food_total(month: str) -> tuple[list[Record], int]:
 def get_dating_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total date expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        date_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(note, const.DATING_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    date_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return date_expenses, total
+        return get_month_keyword_total(month, const.DATING_KEYWORDS)
     except Exception as e:
         logger.error(f"Error getting dating total for {month}: {e}", exc_info=True)
         return [], 0
@@ -657,23 +764,7 @@ def get_dating_total(month: str) -> tuple[list[Record], int]:
 def get_rent_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total rent expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        rent_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if const.RENT_KEYWORD in note:
-                amount = r["vnd"]
-                if amount:
-                    rent_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return rent_expenses, total
+        return get_month_keyword_total(month, const.RENT_KEYWORD)
     except Exception as e:
         logger.error(f"Error getting rent total for {month}: {e}", exc_info=True)
         return [], 0
@@ -683,31 +774,9 @@ def get_rent_total(month: str) -> tuple[list[Record], int]:
 def get_other_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total other expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        other_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if not (
-                sheet.has_keyword(note, const.FOOD_KEYWORDS)
-                or sheet.has_keyword(note, const.DATING_KEYWORDS)
-                or sheet.has_keyword(note, const.TRANSPORT_KEYWORDS)
-                or sheet.has_keyword(note, const.LONG_INVEST_KEYWORDS)
-                or sheet.has_keyword(note, const.OPPORTUNITY_INVEST_KEYWORDS)
-                or sheet.has_keyword(note, const.SUPPORT_PARENT_KEYWORDS)
-                or sheet.has_keyword(note, const.RENT_KEYWORD)
-            ):
-                amount = r["vnd"]
-                if amount:
-                    other_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return other_expenses, total
+        return sheet.get_cached_category_total(
+            month, "other", get_other_total_from_columns
+        )
     except Exception as e:
         logger.error(f"Error getting other total for {month}: {e}", exc_info=True)
         return [], 0
@@ -717,23 +786,7 @@ def get_other_total(month: str) -> tuple[list[Record], int]:
 def get_long_investment_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total investment expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        invest_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(note, const.LONG_INVEST_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    invest_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return invest_expenses, total
+        return get_month_keyword_total(month, const.LONG_INVEST_KEYWORDS)
     except Exception as e:
         logger.error(f"Error getting investment total for {month}: {e}", exc_info=True)
         return [], 0
@@ -744,23 +797,7 @@ def get_opportunity_investment_total(
 ) -> tuple[list[Record], int]:
     """Helper to get total opportunity investment expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        invest_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(note, const.OPPORTUNITY_INVEST_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    invest_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return invest_expenses, total
+        return get_month_keyword_total(month, const.OPPORTUNITY_INVEST_KEYWORDS)
     except Exception as e:
         logger.error(
             f"Error getting opportunity investment total for {month}: {e}",
@@ -772,25 +809,9 @@ def get_opportunity_investment_total(
 def get_investment_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total investment expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        invest_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(
-                note, const.OPPORTUNITY_INVEST_KEYWORDS
-            ) or sheet.has_keyword(note, const.LONG_INVEST_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    invest_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return invest_expenses, total
+        return get_month_keyword_total(
+            month, const.OPPORTUNITY_INVEST_KEYWORDS + const.LONG_INVEST_KEYWORDS
+        )
     except Exception as e:
         logger.error(
             f"Error getting opportunity investment total for {month}: {e}",
@@ -803,23 +824,7 @@ def get_investment_total(month: str) -> tuple[list[Record], int]:
 def get_support_parent_total(month: str) -> tuple[list[Record], int]:
     """Helper to get total support parent expenses for a given month"""
     try:
-        # Skip header row and convert to records-like format
-        support_parent_expenses = []
-        total = 0
-
-        # Use cached data for read-only operations
-        all_values = sheet.get_cached_sheet_data(month)
-        records = sheet.convert_values_to_records(all_values)
-
-        for r in records:
-            note = r["note"].lower()
-            if sheet.has_keyword(note, const.SUPPORT_PARENT_KEYWORDS):
-                amount = r["vnd"]
-                if amount:
-                    support_parent_expenses.append(r)
-                    total += sheet.parse_amount(amount)
-
-        return support_parent_expenses, total
+        return get_month_keyword_total(month, const.SUPPORT_PARENT_KEYWORDS)
     except Exception as e:
         logger.error(
             f"Error getting support parent total for {month}: {e}", exc_info=True
@@ -828,6 +833,18 @@ def get_support_parent_total(month: str) -> tuple[list[Record], int]:
 
 
 # helper for totals summary
+# Summary buckets in match priority, with the group totals each one adds to
+_SUMMARY_BUCKETS = [
+    ("food", ("essential", "food_and_travel")),
+    ("gas", ("essential", "food_and_travel")),
+    (const.RENT, ("essential",)),
+    (const.DATING, ()),
+    (const.LONG_INVEST, ("investment",)),
+    (const.OPPORTUNITY_INVEST, ("investment",)),
+    (const.SUPPORT_PARENT, ()),
+]
+
+
 def get_records_summary_by_cat(records: list[Record]) -> dict:
     """Helper to get total expenses summary for a given month"""
     totals = {
@@ -847,8 +864,7 @@ def get_records_summary_by_cat(records: list[Record]) -> dict:
     }
 
     for r in records:
-        note = r["note"].lower()
-        amount = sheet.parse_amount(r["vnd"])
+        amount = r["amount"]
 
         if amount == 0:
             continue
@@ -856,41 +872,62 @@ def get_records_summary_by_cat(records: list[Record]) -> dict:
         totals["expenses"].append(r)
         totals["total"] += amount
 
-        if sheet.has_keyword(note, const.FOOD_KEYWORDS):
-            totals["food"] += amount
-            totals["essential"] += amount
-        elif sheet.has_keyword(note, const.TRANSPORT_KEYWORDS):
-            totals["gas"] += amount
-            totals["essential"] += amount
-        elif sheet.has_keyword(note, const.RENT_KEYWORD):
-            totals["rent"] += amount
-            totals["essential"] += amount
-        elif sheet.has_keyword(note, const.DATING_KEYWORDS):
-            totals["dating"] += amount
-        elif sheet.has_keyword(note, const.LONG_INVEST_KEYWORDS):
-            totals["long_investment"] += amount
-            totals["investment"] += amount
-        elif sheet.has_keyword(note, const.OPPORTUNITY_INVEST_KEYWORDS):
-            totals["opportunity_investment"] += amount
-            totals["investment"] += amount
-        elif sheet.has_keyword(note, const.SUPPORT_PARENT_KEYWORDS):
-            totals["support_parent"] += amount
+        # First matching bucket by priority, found with one keyword scan
+        tags = sheet.get_note_categories(r["note"])
+        for bucket, groups in _SUMMARY_BUCKETS:
+            if bucket in tags:
+                break
         else:
-            totals["other"] += amount
-            totals["essential"] += amount
+            bucket, groups = "other", ("essential",)
 
-    # Calculate food_and_travel total
-    totals["food_and_travel"] = totals["food"] + totals["gas"]
+        totals[bucket] += amount
+        for group in groups:
+            totals[group] += amount
 
     return totals
 
 
+# helper for writing income cells
+def update_income_cells(current_sheet: gspread.Worksheet, values: dict[str, int]):
+    """Write income cells (cell -> amount) in a single API call"""
+    current_sheet.batch_update(
+        [{"range": cell, "values": [[amount]]} for cell, amount in values.items()],
+        value_input_option="USER_ENTERED",
+    )
+    sheet.invalidate_income_cache(current_sheet.id)
+    sheet.bump_config_version()
+
+
+# helper for reading income cells of several months at once
+def get_income_cells(sheets: list[gspread.Worksheet]) -> list[tuple[str, str]]:
+    """Read (freelance, salary) cell values for each sheet in a single API call"""
+    ranges = [
+        absolute_range_name(ws.title, cell)
+        for ws in sheets
+        for cell in (const.FREELANCE_CELL, const.SALARY_CELL)
+    ]
+    result = get_spreadsheet().values_batch_get(ranges)
+
+    values = []
+    for value_range in result.get("valueRanges", []):
+        rows = value_range.get("values")
+        values.append(rows[0][0] if rows and rows[0] else "")
+
+    return list(zip(values[::2], values[1::2]))
+
+
 # helper for get total income
 def get_total_income(current_sheet: gspread.Worksheet) -> int:
     """Helper to get total income from salary and freelance"""
+    cached_income = sheet.get_cached_income(current_sheet.id)
+    if cached_income is not None:
+        return cached_income
+
     try:
-        salary = current_sheet.acell(const.SALARY_CELL).value
-        freelance = current_sheet.acell(const.FREELANCE_CELL).value
+        # Read both income cells in a single API call
+        result = current_sheet.batch_get([const.SALARY_CELL, const.FREELANCE_CELL])
+        salary = result[0][0][0] if len(result) > 0 and result[0] else ""
+        freelance = result[1][0][0] if len(result) > 1 and result[1] else ""
 
         if not salary or salary.strip() == "":
             salary = config["income"]["salary"]
@@ -900,6 +937,7 @@ def get_total_income(current_sheet: gspread.Worksheet) -> int:
         salary = sheet.safe_int(salary)
         freelance = sheet.safe_int(freelance)
         total_income = salary + freelance
+        sheet.set_cached_income(current_sheet.id, total_income)
         return total_income
     except Exception as e:
         logger.error(f"Error getting total income: {e}", exc_info=True)
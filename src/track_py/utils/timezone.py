@@ -1,11 +1,25 @@
 import datetime
-import pytz
+import time
+from zoneinfo import ZoneInfo
 from src.track_py.config import config
 
 # Timezone setup
-timezone = pytz.timezone(config["settings"]["timezone"])
+timezone = ZoneInfo(config["settings"]["timezone"])
+
+# (epoch second, aware datetime) of the last call, replaced as one tuple so
+# reads from other threads always see a matching pair
+_current_time_cache: tuple[int, datetime.datetime | None] = (0, None)
 
 
 def get_current_time() -> datetime.datetime:
-    """Get current time in the configured timezone"""
-    return datetime.datetime.now(timezone)
+    """Get current time in the configured timezone, cached per second"""
+    global _current_time_cache
+
+    now = time.time()
+    second, cached = _current_time_cache
+    if cached is not None and int(now) == second:
+        return cached
+
+    current = datetime.datetime.fromtimestamp(now, timezone)
+    _current_time_cache = (int(now), current)
+    return current
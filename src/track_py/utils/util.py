@@ -1,30 +1,69 @@
 import re
 import json
+import functools
 from datetime import datetime
 from decimal import Decimal
 from src.track_py.const import MONTH_NAMES
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson
+    else 0
+)
+
+
+# Precompiled markdown patterns
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+
 
 # Convert markdown → HTML
 def markdown_to_html(text: str) -> str:
-    text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
-    text = re.sub(r"\*(.+?)\*", r"<i>\1</i>", text)
+    # Most messages have no markdown, skip both regex passes for them
+    if "*" not in text:
+        return text
+    text = _BOLD_RE.sub(r"<b>\1</b>", text)
+    text = _ITALIC_RE.sub(r"<i>\1</i>", text)
     return text
 
 
+@functools.lru_cache(maxsize=256)
 def get_month_display(month: int, year: int) -> str:
     return f"{MONTH_NAMES.get(month, month)}/{year}"
 
 
+# helper for encoding values json/orjson can't handle natively, dispatched
+# on the value type instead of an isinstance chain
+@functools.singledispatch
+def _json_default(o):
+    return f"<<non-serializable: {type(o).__name__}>>"
+
+
+@_json_default.register(datetime)
+@_json_default.register(Decimal)
+def _(o):
+    return str(o)
+
+
 def to_json(data, indent=2) -> str:
     """Safely convert any object to a JSON string with pretty formatting."""
-
-    def default(o):
-        if isinstance(o, (datetime, Decimal)):
-            return str(o)
-        return f"<<non-serializable: {type(o).__name__}>>"
+    # orjson only supports a 2-space indent
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(
+                data, option=_ORJSON_OPTIONS, default=_json_default
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
 
     try:
-        return json.dumps(data, indent=indent, ensure_ascii=False, default=default)
+        return json.dumps(
+            data, indent=indent, ensure_ascii=False, default=_json_default
+        )
     except Exception as e:
         return f"<<JSON encode error: {e}>>"
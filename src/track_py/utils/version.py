@@ -3,22 +3,28 @@ from src.track_py.config import PROJECT_ROOT
 
 VERSION = "VERSION"
 BUILD_TIME = "BUILD_TIME"
+_VERSION_PATH = os.path.join(PROJECT_ROOT, VERSION)
+_BUILD_TIME_PATH = os.path.join(PROJECT_ROOT, BUILD_TIME)
 
 
-def get_version() -> str:
+# helper for reading a version file once at import
+def _read_file(path: str) -> str:
     try:
-        version_file = os.path.join(PROJECT_ROOT, VERSION)
-        with open(version_file) as f:
+        with open(path) as f:
             return f.read().strip()
     except Exception:
         return "unknown"
 
 
+# Files never change during the process lifetime, so read them once
+_VERSION = _read_file(_VERSION_PATH)
+_BUILD_TIME = _read_file(_BUILD_TIME_PATH)
+
+
+def get_version() -> str:
+    return _VERSION
+
+
 # Get build time
 def get_build_time() -> str:
-    try:
-        build_time_file = os.path.join(PROJECT_ROOT, BUILD_TIME)
-        with open(build_time_file) as f:
-            return f.read().strip()
-    except Exception:
-        return "unknown"
+    return _BUILD_TIME
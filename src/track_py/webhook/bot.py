@@ -1,130 +1,330 @@
-from telegram.ext import Application, MessageHandler, CommandHandler, filters
-from telegram import MenuButtonCommands, BotCommand
+import asyncio
+import hashlib
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from telegram.ext import (
+    AIORateLimiter,
+    Application,
+    BaseHandler,
+    MessageHandler,
+    CallbackContext,
+    Defaults,
+    filters,
+)
+from telegram.request import HTTPXRequest
+from telegram import MenuButtonCommands, BotCommand, Message, MessageEntity, Update
 import src.track_py.const as const
+from src.track_py.config import PROJECT_ROOT
 from src.track_py.utils.logger import logger
 import src.track_py.webhook.handlers as handlers
 
 
+@dataclass(slots=True, frozen=True)
+class CommandSpec:
+    """A bot command: names (full name + alias), handler and menu entry"""
+
+    names: tuple[str, ...]
+    callback: Callable
+    # Icon key and text of the menu entry, None to keep it out of the menu
+    icon_key: str | None = None
+    description: str | None = None
+
+
+# Every command with its handler and menu entry, in menu order
+COMMANDS = (
+    CommandSpec(("start", "st"), handlers.start, "start", "Start the bot"),
+    CommandSpec(("help", "h"), handlers.help, "help", "Show help info"),
+    CommandSpec(("today", "t"), handlers.today, "today", "Show today's expense"),
+    CommandSpec(("week", "w"), handlers.week, "week", "Show this week's expenses"),
+    CommandSpec(("month", "m"), handlers.month, "month", "Show this month's expenses"),
+    CommandSpec(("gas", "g"), handlers.gas, "gas", "Show gas expense"),
+    CommandSpec(("food", "f"), handlers.food, "food", "Show food expense"),
+    CommandSpec(("dating", "d"), handlers.dating, "dating", "Show dating expense"),
+    CommandSpec(("other", "o"), handlers.other, "other", "Show other expense"),
+    CommandSpec(
+        ("investment", "i"),
+        handlers.investment,
+        "investment",
+        "Show investment strategy",
+    ),
+    CommandSpec(
+        ("freelance", "fl"), handlers.freelance, "freelance", "Add freelance income"
+    ),
+    CommandSpec(("salary", "sl"), handlers.salary, "salary", "Add salary income"),
+    CommandSpec(("income", "inc"), handlers.income, "income", "Show income details"),
+    CommandSpec(("sort", "s"), handlers.sort, "sort", "Sort expenses"),
+    CommandSpec(("ai", "a"), handlers.ai_analyze, "ai", "Analyze expenses with AI"),
+    CommandSpec(("stats", "stat"), handlers.stats, "stats", "Show expense statistics"),
+    CommandSpec(
+        ("categories", "cat"),
+        handlers.categories,
+        "categories",
+        "Show expense categories",
+    ),
+    CommandSpec(
+        ("sync",), handlers.sync_config, "sync", "Sync config with sheet of next month"
+    ),
+    CommandSpec(
+        ("keywords", "kw"), handlers.list_keywords, "keywords", "List all keywords"
+    ),
+    CommandSpec(("assets", "as"), handlers.list_assets, "asset", "Show assets summary"),
+    CommandSpec(("migrate_assets", "ma"), handlers.migrate_assets),
+    CommandSpec(("price", "pr"), handlers.list_prices, "price", "Show latest prices"),
+)
+
+
+# helper for building the menu commands once at import
+def _build_bot_commands() -> tuple[BotCommand, ...]:
+    icons = const.CATEGORY_ICONS
+    return tuple(
+        BotCommand(spec.names[0], f"{icons[spec.icon_key]} {spec.description}")
+        for spec in COMMANDS
+        if spec.description is not None
+    )
+
+
+BOT_COMMANDS = _build_bot_commands()
+
+_MENU_BUTTON = MenuButtonCommands()
+
+_ERROR_REPLY = "❌ Có lỗi xảy ra. Vui lòng thử lại!"
+
+# Commands and menu are stored by Telegram per bot, so set them once per process
+_bot_commands_ready = False
+
+# Digest of what was last sent to Telegram for this bot, kept on disk so a
+# restart with an unchanged menu skips both API calls
+_commands_digest = hashlib.blake2b(
+    repr(
+        (
+            const.TELEGRAM_TOKEN.split(":", 1)[0],
+            [(c.command, c.description) for c in BOT_COMMANDS],
+            _MENU_BUTTON.type,
+        )
+    ).encode(),
+    digest_size=16,
+).hexdigest()
+_commands_digest_path = os.path.join(PROJECT_ROOT, ".bot_cache", "commands_digest")
+
+# Handlers that rewrite sheet rows keep blocking so they are not interleaved
+BLOCKING_COMMANDS = {handlers.sort}
+
+
+class _PlainTextFilter(filters.MessageFilter):
+    """Same as filters.TEXT & ~filters.COMMAND, as one filter call per update"""
+
+    __slots__ = ()
+
+    def filter(self, message: Message) -> bool:
+        if not message.text:
+            return False
+        entities = message.entities
+        return not (
+            entities
+            and entities[0].type == MessageEntity.BOT_COMMAND
+            and entities[0].offset == 0
+        )
+
+
+# Plain text messages (expenses and delete commands)
+_MSG_FILTER = _PlainTextFilter()
+
+# Command name/alias -> handler, so a command update costs one dict lookup
+# instead of a check_update call per command
+_COMMAND_TABLE = {name: spec.callback for spec in COMMANDS for name in spec.names}
+
+
+class _CommandDispatchHandler(BaseHandler):
+    """Single handler for every command, matched with one _COMMAND_TABLE lookup"""
+
+    __slots__ = ()
+
+    def __init__(self):
+        # Callbacks come from _COMMAND_TABLE, see handle_update
+        super().__init__(None, block=True)
+
+    def check_update(self, update: object) -> str | None:
+        if not isinstance(update, Update):
+            return None
+        # Messages and edited messages only, like CommandHandler's default
+        # filters.UpdateType.MESSAGES; channel posts are not commands
+        message = update.message or update.edited_message
+        if not message or not message.text or not message.entities:
+            return None
+
+        entity = message.entities[0]
+        if entity.type != MessageEntity.BOT_COMMAND or entity.offset != 0:
+            return None
+
+        command, _, target = message.text[1 : entity.length].partition("@")
+        command = command.lower()
+        if command not in _COMMAND_TABLE:
+            return None
+        if target and target.lower() != message.get_bot().username.lower():
+            return None
+        return command
+
+    def collect_additional_context(
+        self,
+        context: CallbackContext,
+        update: Update,
+        application: Application,
+        check_result: str,
+    ) -> None:
+        # Same args CommandHandler would have set
+        message = update.message or update.edited_message
+        context.args = message.text.split()[1:]
+
+    async def handle_update(
+        self,
+        update: Update,
+        application: Application,
+        check_result: str,
+        context: CallbackContext,
+    ) -> None:
+        self.collect_additional_context(context, update, application, check_result)
+        callback = _COMMAND_TABLE[check_result]
+        if callback in BLOCKING_COMMANDS:
+            await callback(update, context)
+        else:
+            application.create_task(callback(update, context), update=update)
+
+
+# Handlers are stateless, so every bot instance shares the ones built here.
+# Both live in group 0 and their filters never overlap, so PTB stops at the
+# first match; the text handler goes first because expense messages are the
+# most frequent update. A separate group would add a check to every update.
+_HANDLERS = [
+    # Message handler for expenses and delete commands
+    MessageHandler(_MSG_FILTER, handlers.handle_message, block=True),
+    # Command dispatcher, blocking only for BLOCKING_COMMANDS
+    _CommandDispatchHandler(),
+]
+
+
+async def _error_handler(update: Update, context: CallbackContext) -> None:
+    """Global error handler shared by every bot instance"""
+    logger.error(
+        "Error in main bot instance: %s", context.error, exc_info=context.error
+    )
+    if update and update.effective_message:
+        try:
+            await update.effective_message.reply_text(_ERROR_REPLY)
+        except Exception as reply_error:
+            logger.error("Failed to send error message: %s", reply_error)
+
+
 # Initialize bot application immediately
 def setup_bot() -> Application:
     """Setup the bot application (synchronous part only)"""
     try:
-        bot_app = Application.builder().token(const.TELEGRAM_TOKEN).build()
-
-        # Command handlers
-        bot_app.add_handler(CommandHandler(["start", "st"], handlers.start))
-        bot_app.add_handler(CommandHandler(["help", "h"], handlers.help))
-        bot_app.add_handler(CommandHandler(["today", "t"], handlers.today))
-        bot_app.add_handler(CommandHandler(["week", "w"], handlers.week))
-        bot_app.add_handler(CommandHandler(["month", "m"], handlers.month))
-        bot_app.add_handler(CommandHandler(["gas", "g"], handlers.gas))
-        bot_app.add_handler(CommandHandler(["food", "f"], handlers.food))
-        bot_app.add_handler(CommandHandler(["dating", "d"], handlers.dating))
-        bot_app.add_handler(CommandHandler(["other", "o"], handlers.other))
-        bot_app.add_handler(CommandHandler(["investment", "i"], handlers.investment))
-        bot_app.add_handler(CommandHandler(["freelance", "fl"], handlers.freelance))
-        bot_app.add_handler(CommandHandler(["salary", "sl"], handlers.salary))
-        bot_app.add_handler(CommandHandler(["income", "inc"], handlers.income))
-        bot_app.add_handler(CommandHandler(["sort", "s"], handlers.sort))
-        bot_app.add_handler(CommandHandler(["ai", "a"], handlers.ai_analyze))
-        bot_app.add_handler(CommandHandler(["stats", "stat"], handlers.stats))
-        bot_app.add_handler(CommandHandler(["categories", "cat"], handlers.categories))
-        bot_app.add_handler(CommandHandler(["sync", "sync"], handlers.sync_config))
-        bot_app.add_handler(CommandHandler(["keywords", "kw"], handlers.list_keywords))
-        bot_app.add_handler(CommandHandler(["assets", "as"], handlers.list_assets))
-        bot_app.add_handler(
-            CommandHandler(["migrate_assets", "ma"], handlers.migrate_assets)
+        bot_app = (
+            Application.builder()
+            .token(const.TELEGRAM_TOKEN)
+            # One pooled HTTP/2 connection carries every Bot API call of the app
+            .request(
+                HTTPXRequest(
+                    connection_pool_size=32,
+                    http_version="2",
+                    read_timeout=10,
+                    write_timeout=10,
+                )
+            )
+            # Run handlers as concurrent tasks so a slow one does not stall the rest
+            .defaults(Defaults(block=False))
+            # Retry on 429 only: each update runs in its own event loop, and the
+            # limiter's throttles hold loop-bound waiters, so they cannot be
+            # shared across updates and a per-bot throttle would count nothing
+            .rate_limiter(
+                AIORateLimiter(overall_max_rate=0, group_max_rate=0, max_retries=3)
+            )
+            .build()
         )
-        bot_app.add_handler(CommandHandler(["price", "pr"], handlers.list_prices))
+    except Exception:
+        logger.exception("Error setting up bot")
+        raise
 
-        # Message handler for expenses and delete commands
-        bot_app.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, handlers.handle_message)
-        )
+    bot_app.add_handlers(_HANDLERS)
 
-        # Add error handler to prevent "No error handlers are registered" warnings
-        async def error_handler(update, context):
-            """Global error handler for main bot instance"""
-            logger.error(
-                f"Error in main bot instance: {context.error}", exc_info=context.error
-            )
-            if update and update.effective_message:
-                try:
-                    await update.effective_message.reply_text(
-                        "❌ Có lỗi xảy ra. Vui lòng thử lại!"
-                    )
-                except Exception as reply_error:
-                    logger.error(f"Failed to send error message: {reply_error}")
+    # Add error handler to prevent "No error handlers are registered" warnings
+    bot_app.add_error_handler(_error_handler)
 
-        bot_app.add_error_handler(error_handler)
+    logger.info("Bot application setup completed!")
+    return bot_app
 
-        logger.info("Bot application setup completed!")
-        return bot_app
 
+# helper for checking the stored commands digest
+def _commands_unchanged() -> bool:
+    try:
+        with open(_commands_digest_path, encoding="utf-8") as f:
+            return f.read().strip() == _commands_digest
+    except Exception:
+        return False
+
+
+# helper for storing the commands digest atomically
+def _save_commands_digest() -> None:
+    tmp_path = f"{_commands_digest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_commands_digest_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_commands_digest)
+        os.replace(tmp_path, _commands_digest_path)
     except Exception as e:
-        logger.error(f"Error setting up bot: {e}")
-        raise
+        logger.warning("Could not write bot commands digest: %s", e)
+
+
+# Read the stored digest once at import instead of on every update
+if _commands_unchanged():
+    logger.info("Bot commands and menu unchanged, skipping setup")
+    _bot_commands_ready = True
 
 
 async def setup_bot_commands(bot_app: Application) -> None:
-    """Setup bot commands and menu (async part)"""
+    """Setup bot commands and menu (async part), once per process"""
+    global _bot_commands_ready
+
+    if _bot_commands_ready:
+        return
+
     try:
-        # Set custom menu button
-        commands = [
-            BotCommand("start", f"{const.CATEGORY_ICONS['start']} Start the bot"),
-            BotCommand("help", f"{const.CATEGORY_ICONS['help']} Show help info"),
-            BotCommand(
-                "today", f"{const.CATEGORY_ICONS['today']} Show today's expense"
-            ),
-            BotCommand(
-                "week", f"{const.CATEGORY_ICONS['week']} Show this week's expenses"
-            ),
-            BotCommand(
-                "month", f"{const.CATEGORY_ICONS['month']} Show this month's expenses"
-            ),
-            BotCommand("gas", f"{const.CATEGORY_ICONS['gas']} Show gas expense"),
-            BotCommand("food", f"{const.CATEGORY_ICONS['food']} Show food expense"),
-            BotCommand(
-                "dating", f"{const.CATEGORY_ICONS['dating']} Show dating expense"
-            ),
-            BotCommand("other", f"{const.CATEGORY_ICONS['other']} Show other expense"),
-            BotCommand(
-                "investment",
-                f"{const.CATEGORY_ICONS['investment']} Show investment strategy",
-            ),
-            BotCommand(
-                "freelance", f"{const.CATEGORY_ICONS['freelance']} Add freelance income"
-            ),
-            BotCommand("salary", f"{const.CATEGORY_ICONS['salary']} Add salary income"),
-            BotCommand(
-                "income", f"{const.CATEGORY_ICONS['income']} Show income details"
-            ),
-            BotCommand("sort", f"{const.CATEGORY_ICONS['sort']} Sort expenses"),
-            BotCommand("ai", f"{const.CATEGORY_ICONS['ai']} Analyze expenses with AI"),
-            BotCommand(
-                "stats", f"{const.CATEGORY_ICONS['stats']} Show expense statistics"
-            ),
-            BotCommand(
-                "categories",
-                f"{const.CATEGORY_ICONS['categories']} Show expense categories",
-            ),
-            BotCommand(
-                "sync",
-                f"{const.CATEGORY_ICONS['sync']} Sync config with sheet of next month",
-            ),
-            BotCommand(
-                "keywords", f"{const.CATEGORY_ICONS['keywords']} List all keywords"
-            ),
-            BotCommand(
-                "assets", f"{const.CATEGORY_ICONS['asset']} Show assets summary"
-            ),
-            BotCommand("price", f"{const.CATEGORY_ICONS['price']} Show latest prices"),
-        ]
-        await bot_app.bot.set_my_commands(commands)
-        await bot_app.bot.set_chat_menu_button(menu_button=MenuButtonCommands())
+        # Independent API calls, send them concurrently
+        await asyncio.gather(
+            bot_app.bot.set_my_commands(BOT_COMMANDS),
+            bot_app.bot.set_chat_menu_button(menu_button=_MENU_BUTTON),
+        )
+        _bot_commands_ready = True
+        await asyncio.to_thread(_save_commands_digest)
 
         logger.info("Bot commands and menu setup completed!")
 
     except Exception as e:
-        logger.error(f"Error setting up bot commands: {e}")
+        logger.error("Error setting up bot commands: %s", e)
+        raise
+
+
+async def setup_bot_and_commands(bot_app: Application) -> None:
+    """Initialize the bot and setup commands and menu, overlapping the API calls"""
+    global _bot_commands_ready
+
+    if _bot_commands_ready:
+        await bot_app.initialize()
+        return
+
+    try:
+        # The menu button does not depend on initialize (get_me)
+        await asyncio.gather(
+            bot_app.initialize(),
+            bot_app.bot.set_chat_menu_button(menu_button=_MENU_BUTTON),
+        )
+        await bot_app.bot.set_my_commands(BOT_COMMANDS)
+        _bot_commands_ready = True
+        await asyncio.to_thread(_save_commands_digest)
+
+        logger.info("Bot initialized, commands and menu setup completed!")
+
+    except Exception as e:
+        logger.error("Error initializing bot and commands: %s", e)
         raise
@@ -7,6 +7,9 @@ from telegram import (
 )
 from telegram.ext import CallbackContext
 import asyncio
+import functools
+import logging
+import re
 from src.track_py.const import MONTH_NAMES, HELP_MSG
 from src.track_py.utils.logger import logger
 import src.track_py.utils.sheet as sheet
@@ -15,36 +18,34 @@ from src.track_py.utils.category import get_categories_response
 import src.track_py.utils.bot as bot
 
 
+# Quick shortcuts for common expenses, keyed in lowercase
+_SHORTCUTS_LOWER = {k.lower(): v for k, v in const.SHORTCUTS.items()}
+
+
+# Expense input: [date [time]] amount [note]; a date token contains "/", a
+# time token contains ":" or "h" (see log_expense for the three cases)
+_LOG_EXPENSE_RE = re.compile(
+    r"(?:(?P<date>\S*/\S*)\s+(?:(?P<time>\S*[:hH]\S*)\s+)?)?"
+    r"(?P<amount>\d+)(?:\s+(?P<note>.*))?",
+    re.DOTALL,
+)
+
+
+def expand_shortcuts(raw_note: str) -> str:
+    """Expand shortcut words in a note, e.g. 'c' -> 'cafe'"""
+    if not raw_note:
+        return raw_note
+    return " ".join(_SHORTCUTS_LOWER.get(p.lower(), p) for p in raw_note.split())
+
+
 def safe_async_handler(handler_func):
     """Decorator to ensure handlers run in a safe async context"""
 
+    @functools.wraps(handler_func)
     async def wrapper(update: Update, context: CallbackContext):
         try:
-            # Get information about the current async context
-            try:
-                current_loop = asyncio.get_running_loop()
-                logger.debug(
-                    f"Handler {handler_func.__name__} running in loop: {id(current_loop)}"
-                )
-
-                if current_loop.is_closed():
-                    logger.error(
-                        f"Current event loop is closed in {handler_func.__name__}"
-                    )
-                    raise RuntimeError("Event loop is closed")
-
-            except RuntimeError as loop_error:
-                logger.error(
-                    f"Event loop issue in {handler_func.__name__}: {loop_error}"
-                )
-                # Try to send a basic error message without using the problematic loop
-                try:
-                    await update.message.reply_text(
-                        f"❌ Có lỗi hệ thống xảy ra. Vui lòng thử lại!\n\nLỗi: {loop_error}"
-                    )
-                except:
-                    pass
-                return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Handler %s running", handler_func.__name__)
 
             # Execute the actual handler
             return await handler_func(update, context)
@@ -56,15 +57,12 @@ def safe_async_handler(handler_func):
             )
             try:
                 # Try to send error message, but don't fail if this also fails
-                await update.message.reply_text(
-                    f"❌ Có lỗi hệ thống xảy ra. Vui lòng thử lại sau!\n\nLỗi: {e}"
-                )
+                await update.message.reply_text(const.ERR_SYSTEM + str(e))
             except Exception as reply_error:
                 logger.error(
                     f"Failed to send error message in {handler_func.__name__}: {reply_error}"
                 )
 
-    wrapper.__name__ = handler_func.__name__
     return wrapper
 
 
@@ -137,87 +135,43 @@ async def log_expense(update: Update, context: CallbackContext):
     - Enhanced error messages with retry guidance
     """
     text = update.message.text.strip()
-    parts = text.split()
 
     try:
         logger.info(
             f"Log expense requested by user {update.effective_user.id}: '{text}'"
         )
 
-        # Quick shortcuts for common expenses
-        shortcuts = const.SHORTCUTS
+        now = sheet.get_current_time()
+
+        # Parse all input formats with one precompiled match
+        match = _LOG_EXPENSE_RE.fullmatch(text)
+        if not match:
+            await update.message.reply_text(const.LOG_EXPENSE_MSG)
+            return
 
-        # Parse different input formats
-        entry_date = None
-        entry_time = None
-        entry_year = None
-        amount = None
-        note = ""
-        target_month = None
+        amount = int(match["amount"])
+        note = expand_shortcuts(" ".join((match["note"] or "").split()))
 
         # Case A: Default Entry (No Date/Time) - 1000 ăn trưa or 5 cf or just "5"
-        if parts[0].isdigit():
-            amount = int(parts[0])
-            raw_note = " ".join(parts[1:])
-
-            # Apply shortcuts to note
-            note_parts = raw_note.split()
-            expanded_parts = []
-            for part in note_parts:
-                expanded_parts.append(shortcuts.get(part.lower(), part))
-            note = " ".join(expanded_parts)
-
-            entry_date = sheet.get_current_time().strftime("%d/%m")
-            entry_time = sheet.get_current_time().strftime("%H:%M:%S")
-            entry_year = sheet.get_current_time().year
-            target_month = sheet.get_current_time().strftime("%m/%Y")
+        if match["date"] is None:
+            entry_date = now.strftime("%d/%m")
+            entry_time = now.strftime("%H:%M:%S")
+            entry_year = now.year
+            target_month = now.strftime("%m/%Y")
 
         # Case B: Date Only - 02/09 5000 cafe or 02/09 5 cf
-        elif "/" in parts[0] and len(parts) >= 2 and parts[1].isdigit():
-            entry_date = sheet.normalize_date(parts[0])
-            amount = int(parts[1])
-            raw_note = " ".join(parts[2:]) if len(parts) > 2 else "Không có ghi chú"
-
-            # Apply shortcuts to note
-            note_parts = raw_note.split()
-            expanded_parts = []
-            for part in note_parts:
-                expanded_parts.append(shortcuts.get(part.lower(), part))
-            note = " ".join(expanded_parts)
-
-            entry_time = "00:00:00"  # Default time
-
-            day, month = entry_date.split("/")
-            entry_year = sheet.get_current_time().year
-            target_month = f"{month}/{entry_year}"
-
         # Case C: Date + Time - 02/09 08:30 15000 breakfast or 02/09 08:30 15 cf
-        elif (
-            "/" in parts[0]
-            and len(parts) >= 3
-            and (":" in parts[1] or "h" in parts[1].lower())
-            and parts[2].isdigit()
-        ):
-            entry_date = sheet.normalize_date(parts[0])
-            entry_time = sheet.normalize_time(parts[1])
-            entry_year = sheet.get_current_time().year
-            amount = int(parts[2])
-            raw_note = " ".join(parts[3:]) if len(parts) > 3 else "Không có ghi chú"
-
-            # Apply shortcuts to note
-            note_parts = raw_note.split()
-            expanded_parts = []
-            for part in note_parts:
-                expanded_parts.append(shortcuts.get(part.lower(), part))
-            note = " ".join(expanded_parts)
+        else:
+            entry_date = sheet.normalize_date(match["date"])
+            if match["time"] is not None:
+                entry_time = sheet.normalize_time(match["time"])
+            else:
+                entry_time = "00:00:00"  # Default time
+            note = note or "Không có ghi chú"
 
             day, month = entry_date.split("/")
-            current_year = sheet.get_current_time().year
-            target_month = f"{month}/{current_year}"
-
-        else:
-            await update.message.reply_text(const.LOG_EXPENSE_MSG)
-            return
+            entry_year = now.year
+            target_month = f"{month}/{entry_year}"
 
         # Smart amount multipliers for faster typing
         amount = amount * 1000
@@ -293,10 +247,11 @@ async def delete_expense(update: Update, context: CallbackContext):
             f"Delete expense requested by user {update.effective_user.id}: '{text}'"
         )
 
+        now = sheet.get_current_time()
         parts = text.split()
         # Only "del 00h11s00" -> assume today's date
         if len(parts) == 2:
-            entry_date = sheet.get_current_time().strftime("%d/%m")
+            entry_date = now.strftime("%d/%m")
             entry_time = sheet.normalize_time(parts[1])
         # Parse delete command: "del 14/10 00h11s00"
         elif len(parts) >= 3:
@@ -308,8 +263,7 @@ async def delete_expense(update: Update, context: CallbackContext):
             return
 
         # Determine target month
-        now = sheet.get_current_time()
-        target_month = sheet.get_current_time().strftime("%m/%Y")
+        target_month = now.strftime("%m/%Y")
 
         # Check if different month
         if "/" in entry_date:
@@ -470,9 +424,7 @@ async def today(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_FETCH_DATA + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in today command: {reply_error}"
@@ -526,9 +478,7 @@ async def week(update: Update, context: CallbackContext):
         logger.info(f"Week summary request queued for user {update.effective_user.id}")
     except Exception as e:
         logger.error(f"Error in week command: {e}", exc_info=True)
-        await update.message.reply_text(
-            f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-        )
+        await update.message.reply_text(const.ERR_FETCH_DATA + str(e))
 
 
 @safe_async_handler
@@ -582,9 +532,7 @@ async def month(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_FETCH_DATA + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in month command: {reply_error}"
@@ -615,18 +563,17 @@ async def ai_analyze(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_FETCH_DATA + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in month command: {reply_error}"
             )
 
 
-@safe_async_handler
-async def gas(update: Update, context: CallbackContext):
-    """Get this month's total gas expenses"""
+# helper for the category summary commands (gas, food, dating, other, investment)
+async def reply_category_summary(
+    update: Update, context: CallbackContext, category: str, summary_fn
+):
     args = context.args
     offset = 0
     if args:
@@ -636,149 +583,57 @@ async def gas(update: Update, context: CallbackContext):
             pass
 
     try:
-        response = sheet.process_gas_summary(offset)
+        response = await summary_fn(offset)
         await update.message.reply_text(response)
 
-        logger.info(f"Gas summary sent successfully to user {update.effective_user.id}")
+        logger.info(
+            f"{category.capitalize()} summary sent successfully to user {update.effective_user.id}"
+        )
     except Exception as e:
         logger.error(
-            f"Error in gas command for user {update.effective_user.id}: {e}",
+            f"Error in {category} command for user {update.effective_user.id}: {e}",
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_FETCH_DATA + str(e))
         except Exception as reply_error:
-            logger.error(f"Failed to send error message in gas command: {reply_error}")
+            logger.error(
+                f"Failed to send error message in {category} command: {reply_error}"
+            )
 
 
 @safe_async_handler
-async def food(update: Update, context: CallbackContext):
-    """Get this month's total food expenses"""
-    args = context.args
-    offset = 0
-    if args:
-        try:
-            offset = int(args[0])
-        except ValueError:
-            pass
+async def gas(update: Update, context: CallbackContext):
+    """Get this month's total gas expenses"""
+    await reply_category_summary(update, context, "gas", sheet.process_gas_summary)
 
-    try:
-        response = sheet.process_food_summary(offset)
-        await update.message.reply_text(response)
 
-        logger.info(
-            f"Food summary sent successfully to user {update.effective_user.id}"
-        )
-    except Exception as e:
-        logger.error(
-            f"Error in food command for user {update.effective_user.id}: {e}",
-            exc_info=True,
-        )
-        try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
-        except Exception as reply_error:
-            logger.error(f"Failed to send error message in food command: {reply_error}")
+@safe_async_handler
+async def food(update: Update, context: CallbackContext):
+    """Get this month's total food expenses"""
+    await reply_category_summary(update, context, "food", sheet.process_food_summary)
 
 
 @safe_async_handler
 async def dating(update: Update, context: CallbackContext):
     """Get this month's total dating expenses"""
-    args = context.args
-    offset = 0
-    if args:
-        try:
-            offset = int(args[0])
-        except ValueError:
-            pass
-
-    try:
-        response = sheet.process_dating_summary(offset)
-        await update.message.reply_text(response)
-
-        logger.info(
-            f"Dating summary sent successfully to user {update.effective_user.id}"
-        )
-    except Exception as e:
-        logger.error(
-            f"Error in dating command for user {update.effective_user.id}: {e}",
-            exc_info=True,
-        )
-        try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
-        except Exception as reply_error:
-            logger.error(f"Failed to send error message in food command: {reply_error}")
+    await reply_category_summary(
+        update, context, "dating", sheet.process_dating_summary
+    )
 
 
 @safe_async_handler
 async def other(update: Update, context: CallbackContext):
     """Get this month's total other expenses"""
-    args = context.args
-    offset = 0
-    if args:
-        try:
-            offset = int(args[0])
-        except ValueError:
-            pass
-
-    try:
-        response = sheet.process_other_summary(offset)
-        await update.message.reply_text(response)
-
-        logger.info(
-            f"Other summary sent successfully to user {update.effective_user.id}"
-        )
-    except Exception as e:
-        logger.error(
-            f"Error in other command for user {update.effective_user.id}: {e}",
-            exc_info=True,
-        )
-        try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
-        except Exception as reply_error:
-            logger.error(
-                f"Failed to send error message in other command: {reply_error}"
-            )
+    await reply_category_summary(update, context, "other", sheet.process_other_summary)
 
 
 @safe_async_handler
 async def investment(update: Update, context: CallbackContext):
     """Get this month's total investment expenses"""
-    args = context.args
-    offset = 0
-    if args:
-        try:
-            offset = int(args[0])
-        except ValueError:
-            pass
-
-    try:
-        response = sheet.get_investment_response(offset)
-        await update.message.reply_text(response)
-
-        logger.info(
-            f"Investment summary sent successfully to user {update.effective_user.id}"
-        )
-    except Exception as e:
-        logger.error(
-            f"Error in investment command for user {update.effective_user.id}: {e}",
-            exc_info=True,
-        )
-        try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
-        except Exception as reply_error:
-            logger.error(
-                f"Failed to send error message in investment command: {reply_error}"
-            )
+    await reply_category_summary(
+        update, context, "investment", sheet.get_investment_response
+    )
 
 
 @safe_async_handler
@@ -819,7 +674,7 @@ async def freelance(update: Update, context: CallbackContext):
         return
 
     try:
-        response = sheet.process_freelance(offset, amount)
+        response = await asyncio.to_thread(sheet.process_freelance, offset, amount)
         await update.message.reply_text(response)
 
         logger.info(
@@ -831,9 +686,7 @@ async def freelance(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Có lỗi xảy ra khi ghi nhận thu nhập. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_SAVE_INCOME + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in freelance command: {reply_error}"
@@ -878,7 +731,7 @@ async def salary(update: Update, context: CallbackContext):
         return
 
     try:
-        response = sheet.process_salary(offset, amount)
+        response = await asyncio.to_thread(sheet.process_salary, offset, amount)
         await update.message.reply_text(response)
 
         logger.info(
@@ -890,9 +743,7 @@ async def salary(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Có lỗi xảy ra khi ghi nhận thu nhập. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_SAVE_INCOME + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in salary command: {reply_error}"
@@ -911,7 +762,7 @@ async def income(update: Update, context: CallbackContext):
 
     """Show total income from sheet"""
     try:
-        response = sheet.process_income_summary(offset)
+        response = await sheet.process_income_summary(offset)
         await update.message.reply_text(response)
 
         logger.info(
@@ -1064,9 +915,7 @@ async def list_assets(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu tài sản. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_FETCH_ASSET + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in assets command: {reply_error}"
@@ -1114,9 +963,7 @@ async def list_prices(update: Update, context: CallbackContext):
             exc_info=True,
         )
         try:
-            await update.message.reply_text(
-                f"❌ Không thể lấy dữ liệu tài sản. Vui lòng thử lại!\n\nLỗi: {e}"
-            )
+            await update.message.reply_text(const.ERR_FETCH_ASSET + str(e))
         except Exception as reply_error:
             logger.error(
                 f"Failed to send error message in assets command: {reply_error}"
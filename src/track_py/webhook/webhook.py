@@ -1,14 +1,14 @@
+import os
 import datetime
 import asyncio
 import threading
 from flask import Flask, request, jsonify
-from dateutil.relativedelta import relativedelta
 from src.track_py.utils.logger import logger
 from telegram import Update
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from flask_cors import CORS
-from src.track_py.webhook.bot import setup_bot, setup_bot_commands
-from src.track_py.utils.bot import wait_for_background_tasks
+from src.track_py.webhook.bot import setup_bot, setup_bot_and_commands
+from src.track_py.utils.bot import wait_for_background_tasks, wait_for_handler_tasks
 import src.track_py.const as const
 import src.track_py.utils.sheet as sheet
 from src.track_py.utils.version import VERSION, BUILD_TIME
@@ -30,6 +30,41 @@ CORS(
 # Start the scheduler when the module is loaded
 start_scheduler()
 
+# Worker threads for the Google Sheets calls each update offloads with
+# asyncio.to_thread; the default pool (cpu_count + 4) is too small for I/O
+_THREAD_POOL_SIZE = int(os.environ.get("THREAD_POOL_SIZE", 64))
+
+# Event loop for each update thread, uvloop when it is installed
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+
+# helper for running an update like asyncio.run(), on a loop from _new_event_loop
+def _run_in_new_loop(coro) -> None:
+    loop = _new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(coro)
+    finally:
+        try:
+            # Cancel leftover tasks and shut down like asyncio.run() does
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
 
 @app.route("/")
 def home():
@@ -242,6 +277,13 @@ def webhook():
 
         # Process the update using asyncio.run in a separate thread
         async def async_process_update():
+            # Every update gets a fresh loop, so size its default executor here
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(
+                    max_workers=_THREAD_POOL_SIZE, thread_name_prefix="sheets"
+                )
+            )
+
             try:
                 logger.info("Processing update asynchronously")
 
@@ -251,10 +293,8 @@ def webhook():
                     try:
                         fresh_bot_app = setup_bot()
 
-                        # Initialize the fresh bot instance
-                        await fresh_bot_app.initialize()
-                        # Set up commands for fresh bot instance
-                        await setup_bot_commands(fresh_bot_app)
+                        # Initialize the fresh bot instance and set up its commands
+                        await setup_bot_and_commands(fresh_bot_app)
                         logger.info("Fresh bot instance initialized successfully")
 
                         # Verify bot is properly initialized by checking if it has a username
@@ -273,6 +313,8 @@ def webhook():
 
                         # Process the update with the fresh instance
                         await fresh_bot_app.process_update(fresh_update)
+                        # Handlers run as tasks, keep the loop alive until they finish
+                        await wait_for_handler_tasks()
                         logger.info(
                             "Update processed successfully with fresh bot instance"
                         )
@@ -310,13 +352,13 @@ def webhook():
                 # Initialize global bot if not already done
                 if not const.bot_app.running:
                     logger.info("Initializing global bot application")
-                    await const.bot_app.initialize()
-                    # Set up commands for global bot instance
-                    await setup_bot_commands(const.bot_app)
+                    # Set up commands for global bot instance while initializing
+                    await setup_bot_and_commands(const.bot_app)
                     logger.info("Global bot application initialized successfully")
 
                 # Process the update with global instance (using original update object)
                 await const.bot_app.process_update(update)
+                await wait_for_handler_tasks()
                 logger.info("Update processed successfully with global bot instance")
 
             except Exception as process_error:
@@ -342,9 +384,9 @@ def webhook():
                     # Good, no running loop
                     logger.info("No existing event loop found - creating fresh context")
 
-                # Use asyncio.run() which creates and manages its own event loop
+                # Creates and manages its own event loop, like asyncio.run()
                 logger.info("Starting asyncio.run() for update processing")
-                asyncio.run(async_process_update())
+                _run_in_new_loop(async_process_update())
                 logger.info("asyncio.run() completed successfully")
 
             except RuntimeError as runtime_error:
@@ -355,7 +397,7 @@ def webhook():
                 # Try alternative approach with manual event loop management
                 try:
                     logger.info("Attempting fallback with manual event loop management")
-                    loop = asyncio.new_event_loop()
+                    loop = _new_event_loop()
                     asyncio.set_event_loop(loop)
                     try:
                         logger.info(f"Created new event loop: {id(loop)}")
@@ -481,15 +523,25 @@ async def expense_dashboard():
         target_month = now.strftime("%m/%Y")
         sheet_name = now.strftime("%m/%Y")
 
-        month_value = await asyncio.to_thread(sheet.get_cached_sheet_data, sheet_name)
-
-        # Get week and daily data concurrently
+        # Get month, week, daily data, budget and category percentages concurrently
+        month_records_task = asyncio.to_thread(sheet.get_month_records, sheet_name)
         week_data_task = sheet.get_week_process_data(now)
         daily_data_task = sheet.get_daily_process_data(now)
         month_budget_task = sheet.get_month_budget(target_month)
-
-        week_data, daily_data, month_budget = await asyncio.gather(
-            week_data_task, daily_data_task, month_budget_task
+        category_percent_task = sheet.get_category_percentages_by_sheet_name(sheet_name)
+
+        (
+            month_records,
+            week_data,
+            daily_data,
+            month_budget,
+            category_percent,
+        ) = await asyncio.gather(
+            month_records_task,
+            week_data_task,
+            daily_data_task,
+            month_budget_task,
+            category_percent_task,
         )
 
         # Get the worksheet for the target week
@@ -501,9 +553,7 @@ async def expense_dashboard():
         day_records = daily_data["records"]
 
         # Summarize records by category concurrently
-        month_summary = sheet.get_records_summary_by_cat(
-            sheet.convert_values_to_records(month_value)
-        )
+        month_summary = sheet.get_records_summary_by_cat(month_records)
         week_summary = sheet.get_records_summary_by_cat(week_records)
         day_summary = sheet.get_records_summary_by_cat(day_records)
 
@@ -530,9 +580,6 @@ async def expense_dashboard():
         week_categories = []
         day_categories = []
 
-        category_percent = await sheet.get_category_percentages_by_sheet_name(
-            sheet_name
-        )
         cat_meta = {
             cat: {
                 "color": const.CATEGORY_COLORS.get(cat, "#000000"),